@@ -33,10 +33,13 @@ if (!fs.existsSync(videoDir)) {
 }
 
 // Get all video files from directory
-const videoExtensions = ['.mp4', '.mov', '.avi', '.mkv', '.webm']
-const videoFiles = fs.readdirSync(videoDir)
-  .filter(file => videoExtensions.some(ext => file.toLowerCase().endsWith(ext)))
-  .map(file => path.join(videoDir, file))
+// withFileTypes skips subdirectories without a stat per entry (symlinks are
+// kept, as they usually point at video files), and the extension check is a
+// single Set lookup per file
+const videoExtensions = new Set(['.mp4', '.mov', '.avi', '.mkv', '.webm'])
+const videoFiles = fs.readdirSync(videoDir, { withFileTypes: true })
+  .filter(entry => (entry.isFile() || entry.isSymbolicLink()) && videoExtensions.has(path.extname(entry.name).toLowerCase()))
+  .map(entry => path.join(videoDir, entry.name))
 
 if (videoFiles.length === 0) {
   console.error(`❌ No video files found in: ${videoDir}`)
@@ -0,0 +1,57 @@
+import { mapWithConcurrency } from '@/lib/utils/concurrency'
+
+describe('concurrency utils', () => {
+  const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms))
+
+  test('preserves input order in the results', async () => {
+    const results = await mapWithConcurrency([30, 10, 20], 3, async (ms, index) => {
+      await delay(ms)
+      return `${index}:${ms}`
+    })
+
+    expect(results).toEqual(['0:30', '1:10', '2:20'])
+  })
+
+  test('never runs more than the limit at once', async () => {
+    let inFlight = 0
+    let maxInFlight = 0
+
+    await mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+      inFlight++
+      maxInFlight = Math.max(maxInFlight, inFlight)
+      await delay(5)
+      inFlight--
+    })
+
+    expect(maxInFlight).toBe(3)
+  })
+
+  test('returns an empty array for no items', async () => {
+    expect(await mapWithConcurrency([], 4, async () => 1)).toEqual([])
+  })
+
+  test('rejects when a call fails', async () => {
+    await expect(
+      mapWithConcurrency([1, 2], 2, async (n) => {
+        if (n === 2) throw new Error('boom')
+        return n
+      })
+    ).rejects.toThrow('boom')
+  })
+
+  test('starts no further items after a call fails', async () => {
+    const started: number[] = []
+
+    await expect(
+      mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 2, async (n) => {
+        started.push(n)
+        // Item 1 fails while item 0 is still in flight
+        await delay(n === 1 ? 1 : 10)
+        if (n === 1) throw new Error('boom')
+        return n
+      })
+    ).rejects.toThrow('boom')
+
+    expect(started).toEqual([0, 1])
+  })
+})
@@ -0,0 +1,53 @@
+import { calculateModelPerformance, ComparisonSubmissionScores } from '@/lib/utils/model-performance'
+
+describe('model performance utils', () => {
+  const createSubmission = (
+    dimensionScores: Record<string, string> | null,
+    modelA = 'model-a',
+    modelB = 'model-b'
+  ): ComparisonSubmissionScores => ({
+    dimensionScores,
+    twoVideoComparisonTask: { modelA, modelB }
+  })
+
+  const find = (performance: ReturnType<typeof calculateModelPerformance>, model: string, dimension: string) =>
+    performance.find(p => p.model === model && p.dimension === dimension)
+
+  test('counts wins for the chosen model and totals for both', () => {
+    const performance = calculateModelPerformance([
+      createSubmission({ overall_quality: 'A' }),
+      createSubmission({ overall_quality: 'A' }),
+      createSubmission({ overall_quality: 'B' })
+    ])
+
+    expect(find(performance, 'model-a', 'overall_quality')).toEqual({
+      model: 'model-a',
+      dimension: 'overall_quality',
+      win_rate: 2 / 3,
+      num_twoVideoComparisonSubmissions: 3
+    })
+    expect(find(performance, 'model-b', 'overall_quality')?.win_rate).toBeCloseTo(1 / 3)
+  })
+
+  test('counts ties as half a win for both models', () => {
+    const performance = calculateModelPerformance([
+      createSubmission({ controllability: 'tie' })
+    ])
+
+    expect(find(performance, 'model-a', 'controllability')?.win_rate).toBe(0.5)
+    expect(find(performance, 'model-b', 'controllability')?.win_rate).toBe(0.5)
+  })
+
+  test('ignores unknown choices and missing scores', () => {
+    const performance = calculateModelPerformance([
+      createSubmission({ visual_quality: 'skip' }),
+      createSubmission(null)
+    ])
+
+    expect(performance).toEqual([])
+  })
+
+  test('returns an empty array for no submissions', () => {
+    expect(calculateModelPerformance([])).toEqual([])
+  })
+})
@@ -0,0 +1,26 @@
+import { createRandom } from '@/lib/utils/random'
+
+describe('random utils', () => {
+  const take = (random: () => number, count: number) =>
+    Array.from({ length: count }, () => random())
+
+  test('the same seed produces the same sequence', () => {
+    expect(take(createRandom(42), 20)).toEqual(take(createRandom(42), 20))
+  })
+
+  test('different seeds produce different sequences', () => {
+    expect(take(createRandom(1), 20)).not.toEqual(take(createRandom(2), 20))
+  })
+
+  test('values fall in [0, 1)', () => {
+    for (const value of take(createRandom(7), 1000)) {
+      expect(value).toBeGreaterThanOrEqual(0)
+      expect(value).toBeLessThan(1)
+    }
+  })
+
+  test('falls back to Math.random without a seed', () => {
+    expect(createRandom()).toBe(Math.random)
+    expect(createRandom(null)).toBe(Math.random)
+  })
+})
@@ -1,10 +1,15 @@
-import { generateSlug, isValidSlug, slugify } from '@/lib/utils/slug'
+import { createWithUniqueSlug, generateSlug, isSlugConflict, isValidSlug, slugify } from '@/lib/utils/slug'
 
 // Mock nanoid to make tests deterministic
 jest.mock('nanoid', () => ({
   customAlphabet: () => () => 'mock123'
 }))
 
+const mockFindMany = jest.fn()
+jest.mock('@/lib/prisma', () => ({
+  prisma: { experiment: { findMany: (...args: unknown[]) => mockFindMany(...args) } }
+}))
+
 describe('slug utils', () => {
   describe('generateSlug', () => {
     test('generates a slug with the expected format', () => {
@@ -76,4 +81,54 @@ describe('slug utils', () => {
       expect(slugify('test___underscores')).toBe('test-underscores')
     })
   })
-})
\ No newline at end of file
+
+  describe('isSlugConflict', () => {
+    test('matches unique violations on the slug', () => {
+      expect(isSlugConflict({ code: 'P2002', meta: { target: ['slug'] } })).toBe(true)
+      expect(isSlugConflict({ code: 'P2002', meta: { target: 'Experiment_slug_key' } })).toBe(true)
+    })
+
+    test('ignores other fields and errors', () => {
+      expect(isSlugConflict({ code: 'P2002', meta: { target: ['prolificId'] } })).toBe(false)
+      expect(isSlugConflict({ code: 'P2025' })).toBe(false)
+      expect(isSlugConflict(new Error('boom'))).toBe(false)
+      expect(isSlugConflict(null)).toBe(false)
+    })
+  })
+
+  describe('createWithUniqueSlug', () => {
+    beforeEach(() => {
+      mockFindMany.mockReset()
+    })
+
+    test('creates under the first free slug', async () => {
+      mockFindMany.mockResolvedValue([{ slug: 'my-study' }])
+      const create = jest.fn(async (slug: string) => ({ slug }))
+
+      await expect(createWithUniqueSlug('My Study', 'experiment', create)).resolves.toEqual({ slug: 'my-study-2' })
+      expect(create).toHaveBeenCalledTimes(1)
+    })
+
+    test('retries with the next free slug when the slug is claimed concurrently', async () => {
+      mockFindMany
+        .mockResolvedValueOnce([])
+        .mockResolvedValueOnce([{ slug: 'my-study' }])
+      const create = jest.fn(async (slug: string) => {
+        if (slug === 'my-study') throw { code: 'P2002', meta: { target: ['slug'] } }
+        return { slug }
+      })
+
+      await expect(createWithUniqueSlug('my-study', 'experiment', create)).resolves.toEqual({ slug: 'my-study-2' })
+      expect(create).toHaveBeenCalledTimes(2)
+    })
+
+    test('rethrows errors that are not slug conflicts', async () => {
+      mockFindMany.mockResolvedValue([])
+      const error = { code: 'P2002', meta: { target: ['prolificId'] } }
+      const create = jest.fn(async () => { throw error })
+
+      await expect(createWithUniqueSlug('my-study', 'experiment', create)).rejects.toBe(error)
+      expect(create).toHaveBeenCalledTimes(1)
+    })
+  })
+})
@@ -255,8 +255,7 @@ export default function AdminPage() {
 
   const handleRefresh = async () => {
     setRefreshing(true)
-    await fetchAllData()
-    await fetchVideoLibrary()
+    await Promise.all([fetchAllData(), fetchVideoLibrary()])
   }
 
   const handleVideoUpload = async (event: React.ChangeEvent<HTMLInputElement>) => {
@@ -176,57 +176,47 @@ export async function DELETE(
       );
     }
 
-    // Delete related data in correct order to avoid foreign key constraint violations
-    
-    // First, get all participants for this experiment
-    const participants = await prisma.participant.findMany({
-      where: { experimentId: id },
-      select: { id: true }
-    });
-    
-    const participantIds = participants.map(p => p.id);
-
-    // 1. Delete all submissions by participant ID to ensure we catch all references
-    await prisma.twoVideoComparisonSubmission.deleteMany({
-      where: { 
-        participantId: { in: participantIds }
-      }
-    });
-
-    await prisma.singleVideoEvaluationSubmission.deleteMany({
-      where: { 
-        participantId: { in: participantIds }
-      }
-    });
-
-    // 2. Also delete any submissions directly by experiment ID as a safety net
-    await prisma.twoVideoComparisonSubmission.deleteMany({
-      where: { experimentId: id }
-    });
-
-    await prisma.singleVideoEvaluationSubmission.deleteMany({
-      where: { experimentId: id }
-    });
-
-    // 3. Now safe to delete participants (no more foreign key references)
-    await prisma.participant.deleteMany({
-      where: { experimentId: id }
-    });
-
-    // 4. Delete comparisons (they reference experiment)
-    await prisma.twoVideoComparisonTask.deleteMany({
-      where: { experimentId: id }
-    });
-
-    // 5. Delete video tasks (they reference experiment)
-    await prisma.singleVideoEvaluationTask.deleteMany({
-      where: { experimentId: id }
-    });
-
-    // 6. Finally delete the experiment
-    await prisma.experiment.delete({
-      where: { id }
-    });
+    // Delete related data in correct order to avoid foreign key constraint violations.
+    // Everything runs in one transaction so a failure can't leave the experiment
+    // half-deleted.
+    await prisma.$transaction([
+      // 1. Delete submissions made by this experiment's participants, plus any
+      //    submissions referencing the experiment directly as a safety net
+      prisma.twoVideoComparisonSubmission.deleteMany({
+        where: {
+          OR: [
+            { experimentId: id },
+            { participant: { experimentId: id } }
+          ]
+        }
+      }),
+      prisma.singleVideoEvaluationSubmission.deleteMany({
+        where: {
+          OR: [
+            { experimentId: id },
+            { participant: { experimentId: id } }
+          ]
+        }
+      }),
+
+      // 2. Now safe to delete participants (no more foreign key references)
+      prisma.participant.deleteMany({
+        where: { experimentId: id }
+      }),
+
+      // 3. Delete comparisons and video tasks (they reference experiment)
+      prisma.twoVideoComparisonTask.deleteMany({
+        where: { experimentId: id }
+      }),
+      prisma.singleVideoEvaluationTask.deleteMany({
+        where: { experimentId: id }
+      }),
+
+      // 4. Finally delete the experiment
+      prisma.experiment.delete({
+        where: { id }
+      })
+    ]);
 
     return NextResponse.json({ message: 'Experiment deleted successfully' });
   } catch (error) {
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { prisma } from '@/lib/prisma'
-import { generateUniqueSlug } from '@/lib/utils/slug'
+import { createWithUniqueSlug } from '@/lib/utils/slug'
+import { createRandom } from '@/lib/utils/random'
 
 interface ComparisonMatrix {
   scenarios: string[]
@@ -32,28 +33,64 @@ interface VideoAssignmentResult {
   metadata: any
 }
 
-async function findVideosForModel(modelName: string, scenarioId?: string) {
-  return await prisma.video.findMany({
-    where: {
-      modelName,
-      ...(scenarioId && { scenarioId })
-    }
+interface LibraryVideo {
+  url: string
+  modelName: string | null
+  scenarioId: string | null
+}
+
+interface VideoIndex {
+  byModel: Map<string, LibraryVideo[]>
+  byModelScenario: Map<string, LibraryVideo[]>
+}
+
+// Load every video for the matrix's models in one query and index it by model
+// and by (model, scenario), instead of querying per pair and per scenario
+async function loadVideoIndex(models: string[]): Promise<VideoIndex> {
+  const videos = await prisma.video.findMany({
+    where: { modelName: { in: models } },
+    select: { url: true, modelName: true, scenarioId: true }
   })
+
+  const byModel = new Map<string, LibraryVideo[]>()
+  const byModelScenario = new Map<string, LibraryVideo[]>()
+  for (const video of videos) {
+    if (!video.modelName) continue
+    const modelVideos = byModel.get(video.modelName)
+    if (modelVideos) modelVideos.push(video)
+    else byModel.set(video.modelName, [video])
+
+    if (video.scenarioId) {
+      const key = `${video.modelName}::${video.scenarioId}`
+      const scenarioVideos = byModelScenario.get(key)
+      if (scenarioVideos) scenarioVideos.push(video)
+      else byModelScenario.set(key, [video])
+    }
+  }
+
+  return { byModel, byModelScenario }
+}
+
+function findVideosForModel(index: VideoIndex, modelName: string, scenarioId?: string): LibraryVideo[] {
+  return (scenarioId
+    ? index.byModelScenario.get(`${modelName}::${scenarioId}`)
+    : index.byModel.get(modelName)) ?? []
 }
 
-async function assignVideosAutomatically(
+function assignVideosAutomatically(
+  index: VideoIndex,
   modelA: string, 
   modelB: string, 
   scenarioId: string
-): Promise<{ videoAUrl: string; videoBUrl: string } | null> {
+): { videoAUrl: string; videoBUrl: string } | null {
   // Find videos for both models in this scenario
-  const videosA = await findVideosForModel(modelA, scenarioId)
-  const videosB = await findVideosForModel(modelB, scenarioId)
+  const videosA = findVideosForModel(index, modelA, scenarioId)
+  const videosB = findVideosForModel(index, modelB, scenarioId)
 
   if (videosA.length === 0 || videosB.length === 0) {
     // Fallback: try to find videos by model name only
-    const fallbackVideosA = await findVideosForModel(modelA)
-    const fallbackVideosB = await findVideosForModel(modelB)
+    const fallbackVideosA = findVideosForModel(index, modelA)
+    const fallbackVideosB = findVideosForModel(index, modelB)
     
     if (fallbackVideosA.length === 0 || fallbackVideosB.length === 0) {
       return null
@@ -73,22 +110,22 @@ async function assignVideosAutomatically(
   }
 }
 
-async function assignVideosRandomly(
+function assignVideosRandomly(
+  index: VideoIndex,
   modelA: string, 
   modelB: string, 
   scenarioId: string,
-  seed?: number
-): Promise<{ videoAUrl: string; videoBUrl: string } | null> {
-  const videosA = await findVideosForModel(modelA, scenarioId)
-  const videosB = await findVideosForModel(modelB, scenarioId)
+  random: () => number
+): { videoAUrl: string; videoBUrl: string } | null {
+  const videosA = findVideosForModel(index, modelA, scenarioId)
+  const videosB = findVideosForModel(index, modelB, scenarioId)
 
   if (videosA.length === 0 || videosB.length === 0) {
     return null
   }
 
-  // Simple random selection (could be enhanced with proper seeded randomization)
-  const randomA = Math.floor(Math.random() * videosA.length)
-  const randomB = Math.floor(Math.random() * videosB.length)
+  const randomA = Math.floor(random() * videosA.length)
+  const randomB = Math.floor(random() * videosB.length)
 
   return {
     videoAUrl: videosA[randomA].url,
@@ -111,9 +148,12 @@ function generateModelPairs(models: string[]): Array<[string, string]> {
 async function generateMatrixComparisons(matrix: ComparisonMatrix): Promise<VideoAssignmentResult[]> {
   const { scenarios, models, videoAssignment, randomization } = matrix
   const comparisons: VideoAssignmentResult[] = []
+  // Seeded so a matrix with a seed always produces the same assignment, swaps and order
+  const random = createRandom(randomization.seed)
   
   // Generate all model pairs
   const modelPairs = generateModelPairs(models)
+  const videoIndex = await loadVideoIndex(models)
   
   for (const scenarioId of scenarios) {
     for (const [modelA, modelB] of modelPairs) {
@@ -122,10 +162,10 @@ async function generateMatrixComparisons(matrix: ComparisonMatrix): Promise<Vide
       // Assign videos based on strategy
       switch (videoAssignment) {
         case 'auto':
-          videoAssignmentResult = await assignVideosAutomatically(modelA, modelB, scenarioId)
+          videoAssignmentResult = assignVideosAutomatically(videoIndex, modelA, modelB, scenarioId)
           break
         case 'random':
-          videoAssignmentResult = await assignVideosRandomly(modelA, modelB, scenarioId, randomization.seed)
+          videoAssignmentResult = assignVideosRandomly(videoIndex, modelA, modelB, scenarioId, random)
           break
         case 'manual':
           // For manual assignment, we'll need additional UI - skip for now
@@ -143,7 +183,7 @@ async function generateMatrixComparisons(matrix: ComparisonMatrix): Promise<Vide
       let finalVideoB = videoAssignmentResult.videoBUrl
       
       if (randomization.modelPositionRandomization) {
-        const shouldSwap = Math.random() < 0.5
+        const shouldSwap = random() < 0.5
         if (shouldSwap) {
           finalModelA = modelB
           finalModelB = modelA
@@ -171,7 +211,7 @@ async function generateMatrixComparisons(matrix: ComparisonMatrix): Promise<Vide
   if (randomization.orderRandomization) {
     // Fisher-Yates shuffle
     for (let i = comparisons.length - 1; i > 0; i--) {
-      const j = Math.floor(Math.random() * (i + 1));
+      const j = Math.floor(random() * (i + 1));
       [comparisons[i], comparisons[j]] = [comparisons[j], comparisons[i]]
     }
   }
@@ -198,9 +238,6 @@ export async function POST(request: NextRequest) {
       )
     }
     
-    // Ensure unique slug
-    const uniqueSlug = await generateUniqueSlug(body.slug, 'experiment')
-    
     // Generate comparisons based on matrix
     const comparisons = await generateMatrixComparisons(body.matrix)
     
@@ -211,49 +248,51 @@ export async function POST(request: NextRequest) {
       )
     }
     
-    // Create experiment and comparisons in a transaction
-    const result = await prisma.$transaction(async (tx) => {
-      // Create the experiment
-      const experiment = await tx.experiment.create({
-        data: {
-          name: body.name,
-          description: body.description || '',
-          slug: uniqueSlug,
-          group: body.group || '',
-          status: 'draft',
-          config: {
-            mode: body.mode,
-            matrix: body.matrix as any,
-            totalComparisons: comparisons.length,
-            createdAt: new Date().toISOString()
+    // Create experiment and comparisons in a transaction, under a unique slug
+    const result = await createWithUniqueSlug(body.slug, 'experiment', (uniqueSlug) =>
+      prisma.$transaction(async (tx) => {
+        // Create the experiment
+        const experiment = await tx.experiment.create({
+          data: {
+            name: body.name,
+            description: body.description || '',
+            slug: uniqueSlug,
+            group: body.group || '',
+            status: 'draft',
+            config: {
+              mode: body.mode,
+              matrix: body.matrix as any,
+              totalComparisons: comparisons.length,
+              createdAt: new Date().toISOString()
+            }
           }
-        }
-      })
+        })
       
-      // Create all comparisons
-      const comparisonData = comparisons.map((comp, index) => ({
-        experimentId: experiment.id,
-        scenarioId: comp.scenarioId,
-        modelA: comp.modelA,
-        modelB: comp.modelB,
-        videoAPath: comp.videoAUrl,
-        videoBPath: comp.videoBUrl,
-        metadata: {
-          ...comp.metadata,
-          order: index,
-          generatedAt: new Date().toISOString()
-        }
-      }))
+        // Create all comparisons
+        const comparisonData = comparisons.map((comp, index) => ({
+          experimentId: experiment.id,
+          scenarioId: comp.scenarioId,
+          modelA: comp.modelA,
+          modelB: comp.modelB,
+          videoAPath: comp.videoAUrl,
+          videoBPath: comp.videoBUrl,
+          metadata: {
+            ...comp.metadata,
+            order: index,
+            generatedAt: new Date().toISOString()
+          }
+        }))
       
-      await tx.twoVideoComparisonTask.createMany({
-        data: comparisonData
-      })
+        await tx.twoVideoComparisonTask.createMany({
+          data: comparisonData
+        })
       
-      return {
-        experiment,
-        comparisonsCreated: comparisons.length
-      }
-    })
+        return {
+          experiment,
+          comparisonsCreated: comparisons.length
+        }
+      })
+    )
     
     return NextResponse.json({
       success: true,
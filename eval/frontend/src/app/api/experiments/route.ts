@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { requireAdmin } from '@/lib/auth-middleware';
 import { prisma } from '@/lib/prisma';
 import { PrismaClientKnownRequestError } from '@prisma/client/runtime/library';
+import { createWithUniqueSlug } from '@/lib/utils/slug';
 
 async function fetchExperimentsWithRetry(retryCount = 0): Promise<any[]> {
   try {
@@ -293,101 +294,75 @@ export async function POST(request: NextRequest) {
       }
     }
 
-    // Generate unique slug
-    let experimentSlug = slug || name.toLowerCase().replace(/[^a-z0-9]/g, '-')
-    
-    // Check if slug already exists and make it unique if needed
-    let slugExists = await prisma.experiment.findUnique({
-      where: { slug: experimentSlug },
-      select: { id: true }
-    })
-    
-    let counter = 1
-    const baseSlug = experimentSlug
-    
-    while (slugExists) {
-      experimentSlug = `${baseSlug}-${counter}`
-      slugExists = await prisma.experiment.findUnique({
-        where: { slug: experimentSlug },
-        select: { id: true }
-      })
-      counter++
+    const baseSlug = slug || name.toLowerCase().replace(/[^a-z0-9]/g, '-')
+
+    // Collect distinct models and scenarios in a single pass
+    const models = new Set<string>()
+    const scenarios = new Set<string>()
+    for (const comp of comparisons) {
+      models.add(comp.modelA)
+      if (evaluationMode === 'comparison') models.add(comp.modelB)
+      scenarios.add(comp.scenarioId)
     }
 
     // Create experiment with either comparisons or video tasks based on evaluation mode
     const experimentData: any = {
       name,
       description: description || null,
-      slug: experimentSlug,
       group: group || null,
       status: 'draft',
       evaluationMode: evaluationMode,
       organizationId,
       config: {
-        models: evaluationMode === 'comparison' 
-          ? Array.from(new Set([...comparisons.map(c => c.modelA), ...comparisons.map(c => c.modelB)]))
-          : Array.from(new Set(comparisons.map(c => c.modelA))),
-        scenarios: Array.from(new Set(comparisons.map(c => c.scenarioId))),
+        models: Array.from(models),
+        scenarios: Array.from(scenarios),
         demographics: demographics || null
       },
       createdBy: authResult.user?.id || null,
     }
 
+    // Tasks are written with a nested createMany so the whole batch goes out as
+    // one multi-row INSERT rather than one statement per task
     if (evaluationMode === 'single_video') {
       // Create video tasks for single video evaluation
       experimentData.singleVideoEvaluationTasks = {
-        create: comparisons.map(comp => ({
-          scenarioId: comp.scenarioId,
-          modelName: comp.modelA,
-          videoPath: comp.videoAUrl,
-          metadata: comp.metadata || {}
-        }))
+        createMany: {
+          data: comparisons.map(comp => ({
+            scenarioId: comp.scenarioId,
+            modelName: comp.modelA,
+            videoPath: comp.videoAUrl,
+            metadata: comp.metadata || {}
+          }))
+        }
       }
     } else {
       // Create comparisons for comparison evaluation
       experimentData.twoVideoComparisonTasks = {
-        create: comparisons.map(comp => ({
-          scenarioId: comp.scenarioId,
-          modelA: comp.modelA,
-          modelB: comp.modelB,
-          videoAPath: comp.videoAUrl,
-          videoBPath: comp.videoBUrl,
-          metadata: comp.metadata || {}
-        }))
+        createMany: {
+          data: comparisons.map(comp => ({
+            scenarioId: comp.scenarioId,
+            modelA: comp.modelA,
+            modelB: comp.modelB,
+            videoAPath: comp.videoAUrl,
+            videoBPath: comp.videoBUrl,
+            metadata: comp.metadata || {}
+          }))
+        }
       }
     }
 
-    const experiment = await prisma.experiment.create({
-      data: experimentData,
-      include: {
-        twoVideoComparisonTasks: true,
-        singleVideoEvaluationTasks: true,
-        _count: {
-          select: {
-            twoVideoComparisonTasks: true,
-            singleVideoEvaluationTasks: true,
-            participants: {
-              where: {
-                AND: [
-                  {
-                    id: {
-                      not: {
-                        startsWith: 'anon-session-'
-                      }
-                    }
-                  },
-                  {
-                    status: {
-                      not: 'returned'  // Always exclude returned participants
-                    }
-                  }
-                ]
-              }
-            },
-            twoVideoComparisonSubmissions: {
-              where: {
-                status: 'completed',
-                participant: {
+    const experiment = await createWithUniqueSlug(baseSlug, 'experiment', (slug) =>
+      prisma.experiment.create({
+        data: { ...experimentData, slug },
+        include: {
+          twoVideoComparisonTasks: true,
+          singleVideoEvaluationTasks: true,
+          _count: {
+            select: {
+              twoVideoComparisonTasks: true,
+              singleVideoEvaluationTasks: true,
+              participants: {
+                where: {
                   AND: [
                     {
                       id: {
@@ -403,33 +378,54 @@ export async function POST(request: NextRequest) {
                     }
                   ]
                 }
-              }
-            },
-            singleVideoEvaluationSubmissions: {
-              where: {
-                status: 'completed',
-                participant: {
-                  AND: [
-                    {
-                      id: {
-                        not: {
-                          startsWith: 'anon-session-'
+              },
+              twoVideoComparisonSubmissions: {
+                where: {
+                  status: 'completed',
+                  participant: {
+                    AND: [
+                      {
+                        id: {
+                          not: {
+                            startsWith: 'anon-session-'
+                          }
+                        }
+                      },
+                      {
+                        status: {
+                          not: 'returned'  // Always exclude returned participants
                         }
                       }
-                    },
-                    {
-                      status: {
-                        not: 'returned'  // Always exclude returned participants
+                    ]
+                  }
+                }
+              },
+              singleVideoEvaluationSubmissions: {
+                where: {
+                  status: 'completed',
+                  participant: {
+                    AND: [
+                      {
+                        id: {
+                          not: {
+                            startsWith: 'anon-session-'
+                          }
+                        }
+                      },
+                      {
+                        status: {
+                          not: 'returned'  // Always exclude returned participants
+                        }
                       }
-                    }
-                  ]
+                    ]
+                  }
                 }
-              }
-            },
+              },
+            }
           }
         }
-      }
-    });
+      })
+    );
 
     return NextResponse.json(experiment);
   } catch (error) {
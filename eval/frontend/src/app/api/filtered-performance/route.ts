@@ -77,7 +77,7 @@ export async function POST(request: NextRequest) {
     })
 
     // Get all experiments to filter by group if needed
-    let validExperimentIds: string[] = []
+    let validExperimentIds: Set<string> | null = null
     if (filters.experimentGroup && filters.experimentGroup !== 'all' && filters.experimentGroup !== '') {
       const groupExperiments = await prisma.experiment.findMany({
         where: { 
@@ -89,7 +89,7 @@ export async function POST(request: NextRequest) {
         },
         select: { id: true }
       })
-      validExperimentIds = groupExperiments.map(exp => exp.id)
+      validExperimentIds = new Set(groupExperiments.map(exp => exp.id))
     }
 
     // Filter participants based on demographics and experiment group
@@ -100,7 +100,7 @@ export async function POST(request: NextRequest) {
       if (!demographics) return false
 
       // Experiment group filter
-      if (validExperimentIds.length > 0 && !validExperimentIds.includes(participant.experimentId)) {
+      if (validExperimentIds && validExperimentIds.size > 0 && !validExperimentIds.has(participant.experimentId)) {
         return false
       }
 
@@ -154,9 +154,8 @@ export async function POST(request: NextRequest) {
       }
     } else {
       // Otherwise get experiments from filtered participants
-      const experimentIds = Array.from(new Set(finalFilteredParticipants.map(p => p.experimentId)))
       experiments = await prisma.experiment.findMany({
-        where: { id: { in: experimentIds } }
+        where: { id: { in: filteredExperimentIds } }
       })
       evaluationModes = Array.from(new Set(
         experiments.map(exp => (exp as any).evaluationMode || 'comparison')
@@ -208,18 +207,22 @@ export async function POST(request: NextRequest) {
       })
 
 
-      // Process comparison evaluations
-      const comparisonStatsMap: Record<string, {
+      // Process comparison evaluations. Stats are keyed by one flat
+      // (dimension, experiment) key and carry their dimension, so the key
+      // never has to be split back apart
+      type ComparisonStats = {
         A_much_better: number;
         A_slightly_better: number;
         Equal: number;
         B_slightly_better: number;
         B_much_better: number;
         total: number;
+        dimension: string;
         modelA: string;
         modelB: string;
         experimentId: string;
-      }> = {}
+      }
+      const comparisonStatsMap = new Map<string, ComparisonStats>()
 
       for (const evaluation of comparisonEvaluations) {
         // If we queried by experiment directly, we need to apply demographic filters here
@@ -272,20 +275,23 @@ export async function POST(request: NextRequest) {
           
           // Use comparison.experimentId instead of evaluation.experimentId
           const experimentId = evaluation.twoVideoComparisonTask.experimentId
-          const dimensionKey = `${dimension}_${experimentId}`
+          const dimensionKey = `${dimension}\u0000${experimentId}`
           
-          if (!comparisonStatsMap[dimensionKey]) {
-            comparisonStatsMap[dimensionKey] = {
+          let stats = comparisonStatsMap.get(dimensionKey)
+          if (!stats) {
+            stats = {
               A_much_better: 0, A_slightly_better: 0, Equal: 0, 
               B_slightly_better: 0, B_much_better: 0, total: 0,
+              dimension,
               modelA: modelA,
               modelB: modelB,
               experimentId: experimentId
             }
+            comparisonStatsMap.set(dimensionKey, stats)
           }
 
           // Map score to detailed format
-          let mappedScore: keyof typeof comparisonStatsMap[string] | null = null
+          let mappedScore: 'A_much_better' | 'A_slightly_better' | 'Equal' | 'B_slightly_better' | 'B_much_better' | null = null
           switch (score) {
             case 'A_much_better':
             case 'A_Much_Better':
@@ -311,17 +317,17 @@ export async function POST(request: NextRequest) {
               break
           }
 
-          if (mappedScore && mappedScore in comparisonStatsMap[dimensionKey]) {
-            comparisonStatsMap[dimensionKey][mappedScore]++
-            comparisonStatsMap[dimensionKey].total++
+          if (mappedScore) {
+            stats[mappedScore]++
+            stats.total++
           }
         }
       }
 
       // Convert comparison stats to performance format
-      for (const [dimensionKey, stats] of Object.entries(comparisonStatsMap)) {
+      for (const stats of Array.from(comparisonStatsMap.values())) {
         if (stats.total > 0) {
-          const dimension = dimensionKey.split('_').slice(0, -1).join('_')
+          const dimension = stats.dimension
           const modelAWins = stats.A_much_better + stats.A_slightly_better
           const modelBWins = stats.B_much_better + stats.B_slightly_better
           const ties = stats.Equal
@@ -409,13 +415,18 @@ export async function POST(request: NextRequest) {
       })
 
       // Process single video evaluations
-      const singleVideoStatsMap: Record<string, {
+      type SingleVideoStats = {
         totalScore: number;
         count: number;
-        scores: number[];
+        // Ratings of 4 or above, and counts of each whole 1-5 rating indexed
+        // by score (index 0 unused), tallied as scores arrive
+        highScoreCount: number;
+        scoreCounts: number[];
+        dimension: string;
         modelName: string;
         experimentId: string;
-      }> = {}
+      }
+      const singleVideoStatsMap = new Map<string, SingleVideoStats>()
 
       for (const evaluation of singleVideoEvaluations) {
         // If we queried by experiment directly, we need to apply demographic filters here
@@ -464,33 +475,38 @@ export async function POST(request: NextRequest) {
           
           // Use the actual experiment ID - check if it's directly on evaluation or needs to be passed differently
           const experimentId = selectedExperiment || evaluation.experimentId
-          const dimensionKey = `${dimension}_${experimentId}_${modelName}`
+          const dimensionKey = `${dimension}\u0000${experimentId}\u0000${modelName}`
           
-          if (!singleVideoStatsMap[dimensionKey]) {
-            singleVideoStatsMap[dimensionKey] = {
+          let stats = singleVideoStatsMap.get(dimensionKey)
+          if (!stats) {
+            stats = {
               totalScore: 0,
               count: 0,
-              scores: [],
+              highScoreCount: 0,
+              scoreCounts: [0, 0, 0, 0, 0, 0],
+              dimension,
               modelName: modelName,
               experimentId: experimentId
             }
+            singleVideoStatsMap.set(dimensionKey, stats)
           }
 
-          singleVideoStatsMap[dimensionKey].totalScore += score
-          singleVideoStatsMap[dimensionKey].count++
-          singleVideoStatsMap[dimensionKey].scores.push(score)
+          stats.totalScore += score
+          stats.count++
+          if (score >= 4) stats.highScoreCount++
+          if (Number.isInteger(score)) stats.scoreCounts[score]++
         }
       }
 
       // Convert single video stats to performance format
-      for (const [dimensionKey, stats] of Object.entries(singleVideoStatsMap)) {
+      for (const stats of Array.from(singleVideoStatsMap.values())) {
         if (stats.count > 0) {
-          const keyParts = dimensionKey.split('_')
-          const dimension = keyParts.slice(0, -2).join('_') // Remove experimentId and modelName
+          const dimension = stats.dimension
           const averageScore = stats.totalScore / stats.count
           
           // Convert 1-5 scale to 0-1 "quality score" (4-5 considered good)
-          const qualityRate = stats.scores.filter(s => s >= 4).length / stats.scores.length
+          const qualityRate = stats.highScoreCount / stats.count
+          const { scoreCounts } = stats
           
           performance.push({
             model: stats.modelName,
@@ -502,11 +518,11 @@ export async function POST(request: NextRequest) {
             experimentId: stats.experimentId,
             evaluationType: 'single_video',
             score_distribution: {
-              1: stats.scores.filter(s => s === 1).length,
-              2: stats.scores.filter(s => s === 2).length,
-              3: stats.scores.filter(s => s === 3).length,
-              4: stats.scores.filter(s => s === 4).length,
-              5: stats.scores.filter(s => s === 5).length
+              1: scoreCounts[1],
+              2: scoreCounts[2],
+              3: scoreCounts[3],
+              4: scoreCounts[4],
+              5: scoreCounts[5]
             }
           })
         }
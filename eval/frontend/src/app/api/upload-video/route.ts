@@ -26,7 +26,8 @@ export async function POST(request: NextRequest) {
 
     // Verify the experiment exists and optionally check ownership
     const experiment = await prisma.experiment.findUnique({
-      where: { id: experimentId }
+      where: { id: experimentId },
+      select: { createdBy: true }
     });
 
     if (!experiment) {
@@ -35,27 +35,19 @@ export async function GET(
       return NextResponse.json({ error: 'Video not found' }, { status: 404 })
     }
     
-    // Convert stream to buffer
-    const chunks: Uint8Array[] = []
-    const reader = response.Body.transformToWebStream().getReader()
-    
-    while (true) {
-      const { done, value } = await reader.read()
-      if (done) break
-      chunks.push(value)
+    // Stream the object straight through instead of buffering the whole
+    // video in memory and concatenating it into a second copy
+    const headers: Record<string, string> = {
+      'Content-Type': 'video/mp4',
+      'Cache-Control': 'public, max-age=3600', // Cache for 1 hour
+      'Accept-Ranges': 'bytes',
+    }
+    if (response.ContentLength !== undefined) {
+      headers['Content-Length'] = response.ContentLength.toString()
     }
-    
-    const buffer = Buffer.concat(chunks)
     
     // Return video with proper headers
-    return new NextResponse(buffer, {
-      headers: {
-        'Content-Type': 'video/mp4',
-        'Content-Length': buffer.length.toString(),
-        'Cache-Control': 'public, max-age=3600', // Cache for 1 hour
-        'Accept-Ranges': 'bytes',
-      },
-    })
+    return new NextResponse(response.Body.transformToWebStream(), { headers })
     
   } catch (error) {
     console.error('Error proxying video:', error)
@@ -1,6 +1,7 @@
 'use client'
 
 import { useEffect, useState, useCallback, useRef } from 'react'
+import dynamic from 'next/dynamic'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Badge } from '@/components/ui/badge'
@@ -15,7 +16,13 @@ import {
   X
 } from 'lucide-react'
 import { toast } from '@/components/ui/use-toast'
-import { ModelPerformanceChart } from './model-performance-chart'
+
+// recharts is only needed once the chart renders, so keep it out of the
+// admin page's initial bundle
+const ModelPerformanceChart = dynamic(
+  () => import('./model-performance-chart').then(mod => mod.ModelPerformanceChart),
+  { ssr: false }
+)
 
 interface ModelPerformance {
   model: string
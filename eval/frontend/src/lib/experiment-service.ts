@@ -1,7 +1,8 @@
 import { prisma } from '@/lib/prisma';
 import { revalidatePath } from 'next/cache';
-import { Experiment } from '@prisma/client';
+import { Experiment, Prisma } from '@prisma/client';
 import { ExperimentStatus } from '@/lib/utils/status';
+import { createWithUniqueSlug } from '@/lib/utils/slug';
 
 export interface CreateExperimentData {
   name: string;
@@ -29,8 +30,24 @@ export class ExperimentService {
   ) {
     const { groupFilter, includeAnonymous = false } = options || {};
     
-    // Fetch experiments with full participant data to compute correct counts
-    const experimentsRaw = await prisma.experiment.findMany({
+    // Participants that count towards the totals - match CLI logic exactly:
+    // must have a real prolific ID, and a status that is valid for the
+    // experiment type (Prolific experiments only count approved participants)
+    const validParticipant: Prisma.ParticipantWhereInput = {
+      prolificId: { not: null },
+      NOT: [
+        { prolificId: { startsWith: 'anon-' } },
+        ...(includeAnonymous ? [] : [{ id: { startsWith: 'anon-session-' } }]),
+      ],
+      OR: [
+        { experiment: { prolificStudyId: { not: null } }, status: 'approved' },
+        { experiment: { prolificStudyId: null }, status: { in: ['active', 'completed', 'approved'] } },
+      ],
+    };
+
+    // Let the database do the counting instead of loading every participant
+    // and submission row just to filter and count them here
+    const experiments = await prisma.experiment.findMany({
       where: {
         organizationId,
         archived: false,
@@ -57,43 +74,13 @@ export class ExperimentService {
           select: {
             twoVideoComparisonTasks: true,
             singleVideoEvaluationTasks: true,
-          }
-        },
-        participants: {
-          select: {
-            id: true,
-            prolificId: true,
-            status: true
-          }
-        },
-        twoVideoComparisonSubmissions: {
-          where: {
-            status: 'completed'
-          },
-          select: {
-            participantId: true,
-            participant: {
-              select: {
-                id: true,
-                prolificId: true,
-                status: true
-              }
-            }
-          }
-        },
-        singleVideoEvaluationSubmissions: {
-          where: {
-            status: 'completed'
-          },
-          select: {
-            participantId: true,
-            participant: {
-              select: {
-                id: true,
-                prolificId: true,
-                status: true
-              }
-            }
+            participants: { where: validParticipant },
+            twoVideoComparisonSubmissions: {
+              where: { status: 'completed', participant: validParticipant }
+            },
+            singleVideoEvaluationSubmissions: {
+              where: { status: 'completed', participant: validParticipant }
+            },
           }
         }
       },
@@ -102,58 +89,6 @@ export class ExperimentService {
       },
     });
 
-    // Process experiments to compute correct counts based on experiment type
-    const experiments = experimentsRaw.map(exp => {
-      // Determine valid participant filter based on experiment type - match CLI logic exactly
-      const participantStatusFilter = exp.prolificStudyId 
-        ? ['approved']  // For Prolific experiments, only count approved
-        : ['active', 'completed', 'approved'];  // For non-Prolific experiments, count all valid statuses
-        
-      const validParticipants = exp.participants.filter(participant => {
-        // Must have a prolific ID and not be anonymous
-        if (!participant.prolificId || participant.prolificId.startsWith('anon-')) {
-          return false;
-        }
-        
-        // Must have valid status
-        if (!participantStatusFilter.includes(participant.status)) {
-          return false;
-        }
-        
-        // Additional anonymous check for includeAnonymous option
-        if (!includeAnonymous && participant.id.startsWith('anon-session-')) {
-          return false;
-        }
-        
-        return true;
-      });
-
-      const validParticipantIds = validParticipants.map(p => p.id);
-
-      // Count submissions from valid participants only
-      const validTwoVideoSubmissions = exp.twoVideoComparisonSubmissions.filter(sub =>
-        validParticipantIds.includes(sub.participantId)
-      );
-
-      const validSingleVideoSubmissions = exp.singleVideoEvaluationSubmissions.filter(sub =>
-        validParticipantIds.includes(sub.participantId)
-      );
-
-      return {
-        ...exp,
-        participants: undefined,  // Remove participants data from response
-        twoVideoComparisonSubmissions: undefined,  // Remove submissions data from response
-        singleVideoEvaluationSubmissions: undefined,  // Remove submissions data from response
-        _count: {
-          twoVideoComparisonTasks: exp._count.twoVideoComparisonTasks,
-          singleVideoEvaluationTasks: exp._count.singleVideoEvaluationTasks,
-          participants: validParticipants.length,
-          twoVideoComparisonSubmissions: validTwoVideoSubmissions.length,
-          singleVideoEvaluationSubmissions: validSingleVideoSubmissions.length,
-        }
-      };
-    });
-
     return experiments;
   }
 
@@ -193,36 +128,30 @@ export class ExperimentService {
       .replace(/[^a-z0-9]+/g, '-')
       .replace(/^-+|-+$/g, '');
 
-    let slug = baseSlug;
-    let counter = 1;
-
-    while (await prisma.experiment.findFirst({ where: { slug } })) {
-      slug = `${baseSlug}-${counter}`;
-      counter++;
-    }
-
-    const experiment = await prisma.experiment.create({
-      data: {
-        name: data.name,
-        description: data.description,
-        slug,
-        evaluationMode: data.evaluationMode,
-        config: data.config,
-        organizationId: data.organizationId,
-        status: ExperimentStatus.DRAFT,
-      },
-      include: {
-        _count: {
-          select: {
-            twoVideoComparisonTasks: true,
-            singleVideoEvaluationTasks: true,
-            participants: true,
-            twoVideoComparisonSubmissions: true,
-            singleVideoEvaluationSubmissions: true,
+    const experiment = await createWithUniqueSlug(baseSlug, 'experiment', (slug) =>
+      prisma.experiment.create({
+        data: {
+          name: data.name,
+          description: data.description,
+          slug,
+          evaluationMode: data.evaluationMode,
+          config: data.config,
+          organizationId: data.organizationId,
+          status: ExperimentStatus.DRAFT,
+        },
+        include: {
+          _count: {
+            select: {
+              twoVideoComparisonTasks: true,
+              singleVideoEvaluationTasks: true,
+              participants: true,
+              twoVideoComparisonSubmissions: true,
+              singleVideoEvaluationSubmissions: true,
+            },
           },
         },
-      },
-    });
+      })
+    );
 
     revalidatePath(`/api/experiments`);
     return experiment;
@@ -285,22 +214,13 @@ export class ExperimentService {
    * Delete an experiment within the organization
    */
   static async deleteExperiment(experimentId: string, organizationId: string) {
-    // Verify experiment belongs to organization
+    // Verify experiment belongs to organization and check for submissions in one query
     const existingExperiment = await prisma.experiment.findFirst({
       where: {
         id: experimentId,
         organizationId,
       },
-    });
-
-    if (!existingExperiment) {
-      throw new Error('Experiment not found or access denied');
-    }
-
-    // Check if experiment has submissions - if so, archive instead of delete
-    const submissionCount = await prisma.experiment.findFirst({
-      where: { id: experimentId },
-      include: {
+      select: {
         _count: {
           select: {
             twoVideoComparisonSubmissions: true,
@@ -310,8 +230,13 @@ export class ExperimentService {
       },
     });
 
-    const hasSubmissions = (submissionCount?._count.twoVideoComparisonSubmissions ?? 0) > 0 ||
-                          (submissionCount?._count.singleVideoEvaluationSubmissions ?? 0) > 0;
+    if (!existingExperiment) {
+      throw new Error('Experiment not found or access denied');
+    }
+
+    // If experiment has submissions, archive instead of delete
+    const hasSubmissions = existingExperiment._count.twoVideoComparisonSubmissions > 0 ||
+                          existingExperiment._count.singleVideoEvaluationSubmissions > 0;
 
     if (hasSubmissions) {
       // Archive instead of delete if there are submissions
@@ -340,33 +265,39 @@ export class ExperimentService {
    * Get experiment statistics for an organization
    */
   static async getOrganizationExperimentStats(organizationId: string) {
-    const experiments = await prisma.experiment.findMany({
-      where: {
-        organizationId,
-        archived: false,
-      },
-      include: {
-        _count: {
-          select: {
-            twoVideoComparisonSubmissions: true,
-            singleVideoEvaluationSubmissions: true,
-          },
-        },
-      },
-    });
+    const experimentWhere: Prisma.ExperimentWhereInput = {
+      organizationId,
+      archived: false,
+    };
+
+    // Let the database group and count instead of loading every experiment
+    // and filtering the list once per status
+    const [statusGroups, twoVideoSubmissions, singleVideoSubmissions] = await Promise.all([
+      prisma.experiment.groupBy({
+        by: ['status'],
+        where: experimentWhere,
+        _count: { _all: true },
+      }),
+      prisma.twoVideoComparisonSubmission.count({
+        where: { experiment: experimentWhere },
+      }),
+      prisma.singleVideoEvaluationSubmission.count({
+        where: { experiment: experimentWhere },
+      }),
+    ]);
+
+    const countByStatus = new Map(statusGroups.map(g => [g.status, g._count._all]));
 
     const stats = {
-      total: experiments.length,
+      total: statusGroups.reduce((sum, g) => sum + g._count._all, 0),
       byStatus: {
-        DRAFT: experiments.filter(e => e.status === ExperimentStatus.DRAFT).length,
-        READY: experiments.filter(e => e.status === ExperimentStatus.READY).length,
-        ACTIVE: experiments.filter(e => e.status === ExperimentStatus.ACTIVE).length,
-        PAUSED: experiments.filter(e => e.status === ExperimentStatus.PAUSED).length,
-        COMPLETED: experiments.filter(e => e.status === ExperimentStatus.COMPLETED).length,
+        DRAFT: countByStatus.get(ExperimentStatus.DRAFT) ?? 0,
+        READY: countByStatus.get(ExperimentStatus.READY) ?? 0,
+        ACTIVE: countByStatus.get(ExperimentStatus.ACTIVE) ?? 0,
+        PAUSED: countByStatus.get(ExperimentStatus.PAUSED) ?? 0,
+        COMPLETED: countByStatus.get(ExperimentStatus.COMPLETED) ?? 0,
       },
-      totalSubmissions: experiments.reduce((sum, exp) => 
-        sum + exp._count.twoVideoComparisonSubmissions + exp._count.singleVideoEvaluationSubmissions, 0
-      ),
+      totalSubmissions: twoVideoSubmissions + singleVideoSubmissions,
     };
 
     return stats;
@@ -98,8 +98,11 @@ export const COMMON_TAGS = [
   'speed', 'efficiency', 'scale', 'throughput', 'robustness', 'accuracy'
 ]
 
+// Exact-match index over the predefined scenarios, built once at module load
+const SCENARIOS_BY_ID = new Map(PREDEFINED_SCENARIOS.map(s => [s.id, s]))
+
 export function getScenarioById(id: string): ScenarioDefinition | undefined {
-  return PREDEFINED_SCENARIOS.find(s => s.id === id)
+  return SCENARIOS_BY_ID.get(id)
 }
 
 export function getScenariosByCategory(category: string): ScenarioDefinition[] {
@@ -1,10 +1,14 @@
 import { prisma } from '../prisma';
 import Papa from 'papaparse';
 import { shouldUpdateExperimentStatus, ExperimentStatus } from '../utils/status';
+import { mapWithConcurrency } from '../utils/concurrency';
 
 const PROLIFIC_API_URL = 'https://api.prolific.com';
 const PROLIFIC_API_TOKEN = process.env.PROLIFIC_API_TOKEN;
 
+// Number of submissions synced to the database concurrently
+const SYNC_CONCURRENCY = 10;
+
 export interface ProlificStudy {
   id: string;
   name: string;
@@ -398,6 +402,61 @@ export class ProlificService {
     return results;
   }
 
+  /**
+   * Build the participant metadata stored for a Prolific submission
+   */
+  private buildParticipantMetadata(submission: ProlificSubmission, study: ProlificStudy, syncedAt: string) {
+    const {
+      'Age': age,
+      'Sex': sex,
+      'Nationality': nationality,
+      'Language': language,
+      'Country of birth': country_of_birth,
+      'Country of residence': country_of_residence,
+      'Employment status': employment_status,
+      'Student status': student_status,
+    } = submission;
+
+    const participantInfo = {
+      age: age ? Number(age) : undefined,
+      sex,
+      nationality,
+      language,
+      country_of_birth,
+      country_of_residence,
+      employment_status,
+      student_status,
+    };
+
+    // Parse the bonus payments once; both the list and the total derive from it
+    let bonusPayments: number[] = [];
+    if (submission['Bonus payments']) {
+      try {
+        const parsed = JSON.parse(submission['Bonus payments']);
+        bonusPayments = Array.isArray(parsed) ? parsed.map(Number) : [];
+      } catch {
+        bonusPayments = [];
+      }
+    }
+    const bonusTotal = bonusPayments.reduce((a, b) => a + b, 0);
+
+    return {
+      demographics: participantInfo || null,
+      prolificSubmissionId: submission['Submission id'],
+      submissionStatus: submission['Status'],
+      completedDateTime: submission['Completed at'],
+      startedDateTime: submission['Started at'],
+      studyCode: submission['Study code'],
+      reward: study.reward,
+      submissionReward: submission['Reward'] ? Number(submission['Reward']) : undefined,
+      timeTaken: submission['Time taken'] ? Number(submission['Time taken']) : undefined,
+      isComplete: submission['Is complete'] === 'true' || submission['Is complete'] === '1',
+      bonusPayments,
+      totalPayment: (study.reward || 0) + (bonusTotal || 0),
+      lastSyncedAt: syncedAt
+    };
+  }
+
   async syncStudyWithDatabase(studyId: string): Promise<{
     study: ProlificStudy;
     submissions: ProlificSubmission[];
@@ -421,213 +480,139 @@ export class ProlificService {
 
     // Sync participants and their demographic data
     let syncedParticipants = 0;
+    const syncedAt = new Date().toISOString();
     
     console.log(`Found ${submissions.length} submissions to sync`);
     
-    
-    for (const submission of submissions) {
-      try {
-        // Skip if participant ID is missing
-        if (!submission['Participant id']) {
-          console.log(`Skipping submission ${submission['Submission id']}: missing participant ID`);
-          continue;
+    const validSubmissions = submissions.filter(submission => {
+      // Skip if participant ID is missing
+      if (!submission['Participant id']) {
+        console.log(`Skipping submission ${submission['Submission id']}: missing participant ID`);
+        return false;
+      }
+      return true;
+    });
+
+    // Find all existing participants for this experiment in one query instead
+    // of one lookup per submission
+    const existingParticipants = await prisma.participant.findMany({
+      where: {
+        experimentId: experiment.id,
+        OR: [
+          { prolificId: { in: validSubmissions.map(s => s['Participant id']) } },
+          { prolificSubmissionId: { in: validSubmissions.map(s => s['Submission id']) } }
+        ]
+      },
+      select: { id: true, prolificId: true, prolificSubmissionId: true }
+    });
+
+    const participantByProlificId = new Map<string, string>();
+    const participantBySubmissionId = new Map<string, string>();
+    for (const participant of existingParticipants) {
+      if (participant.prolificId) participantByProlificId.set(participant.prolificId, participant.id);
+      if (participant.prolificSubmissionId) participantBySubmissionId.set(participant.prolificSubmissionId, participant.id);
+    }
+
+    const updates: { participantId: string; submission: ProlificSubmission }[] = [];
+    // Keyed by participant ID so a repeated participant is only created once
+    const newSubmissions = new Map<string, ProlificSubmission>();
+    for (const submission of validSubmissions) {
+      const participantId = participantByProlificId.get(submission['Participant id'])
+        ?? participantBySubmissionId.get(submission['Submission id']);
+      if (participantId) {
+        updates.push({ participantId, submission });
+      } else {
+        newSubmissions.set(submission['Participant id'], submission);
+      }
+    }
+
+    // Create new participants for this experiment in a single insert
+    if (newSubmissions.size > 0) {
+      // prolificId is globally unique, so participants already registered in
+      // another experiment are stored without it (original ID kept in metadata)
+      const takenProlificIds = new Set(
+        (await prisma.participant.findMany({
+          where: { prolificId: { in: Array.from(newSubmissions.keys()) } },
+          select: { prolificId: true }
+        })).map(p => p.prolificId)
+      );
+
+      const buildCreateData = (submission: ProlificSubmission, taken: boolean) => {
+        const prolificId = submission['Participant id'];
+        if (taken) {
+          console.log(`⚠️  Participant ${prolificId} already exists in another experiment. Creating with unique session ID.`);
         }
 
-        const {
-          'Age': age,
-          'Sex': sex,
-          'Nationality': nationality,
-          'Language': language,
-          'Country of birth': country_of_birth,
-          'Country of residence': country_of_residence,
-          'Employment status': employment_status,
-          'Student status': student_status,
-        } = submission;
-
-        const participantInfo = {
-          age: age ? Number(age) : undefined,
-          sex,
-          nationality,
-          language,
-          country_of_birth,
-          country_of_residence,
-          employment_status,
-          student_status,
+        return {
+          prolificId: taken ? null : prolificId,
+          ...(taken && { prolificSubmissionId: submission['Submission id'] }),
+          sessionId: `prolific_${prolificId}_${experiment.id}_${Date.now()}`,
+          experimentId: experiment.id,
+          status: submission['Status'].toLowerCase(),
+          assignedTwoVideoComparisonTasks: [],
+          metadata: {
+            ...(taken && { originalProlificId: prolificId }),
+            ...this.buildParticipantMetadata(submission, study, syncedAt)
+          }
         };
+      };
 
-        console.log(`Demographics for participant ${submission['Participant id']}:`, JSON.stringify(participantInfo, null, 2));
-
-        // Find or create participant for this specific experiment
-        // First, try to find existing participant for this experiment
-        let participant = await prisma.participant.findFirst({
-          where: {
-            OR: [
-              {
-                prolificId: submission['Participant id'],
-                experimentId: experiment.id
-              },
-              {
-                prolificSubmissionId: submission['Submission id'],
-                experimentId: experiment.id
-              }
-            ]
-          }
+      try {
+        // No skipDuplicates: a prolificId claimed since the lookup above (e.g.
+        // by a study synced in parallel) must fail the batch so the participant
+        // is re-created below instead of being silently dropped
+        const { count } = await prisma.participant.createMany({
+          data: Array.from(newSubmissions.values()).map(submission =>
+            buildCreateData(submission, takenProlificIds.has(submission['Participant id']))
+          )
         });
-        
-        if (participant) {
-          // Update existing participant for this experiment
-          participant = await prisma.participant.update({
-            where: { id: participant.id },
-            data: {
-              status: submission['Status'].toLowerCase(),
-              metadata: {
-                demographics: participantInfo || null,
-                prolificSubmissionId: submission['Submission id'],
-                submissionStatus: submission['Status'],
-                completedDateTime: submission['Completed at'],
-                startedDateTime: submission['Started at'],
-                studyCode: submission['Study code'],
-                reward: study.reward,
-                submissionReward: submission['Reward'] ? Number(submission['Reward']) : undefined,
-                timeTaken: submission['Time taken'] ? Number(submission['Time taken']) : undefined,
-                isComplete: submission['Is complete'] === 'true' || submission['Is complete'] === '1',
-                bonusPayments: submission['Bonus payments']
-                  ? (() => {
-                      try {
-                        const parsed = JSON.parse(submission['Bonus payments']);
-                        return Array.isArray(parsed) ? parsed.map(Number) : [];
-                      } catch {
-                        return [];
-                      }
-                    })()
-                  : [],
-                totalPayment:
-                  (study.reward || 0) +
-                  ((submission['Bonus payments']
-                    ? (() => {
-                        try {
-                          const parsed = JSON.parse(submission['Bonus payments']);
-                          return Array.isArray(parsed) ? parsed.reduce((a, b) => a + Number(b), 0) : 0;
-                        } catch {
-                          return 0;
-                        }
-                      })()
-                    : 0) || 0),
-                lastSyncedAt: new Date().toISOString()
-              }
-            }
-          });
-        } else {
-          // Create new participant for this experiment
-          // Handle case where prolificId might already exist in another experiment
+        syncedParticipants += count;
+        console.log(`✓ Created ${count} new participants`);
+      } catch (error) {
+        // Fall back to one insert per participant, so one conflicting or bad
+        // row doesn't lose every new participant of the study
+        console.log('Batch participant insert failed, creating participants one by one:', error);
+        await mapWithConcurrency(Array.from(newSubmissions.values()), SYNC_CONCURRENCY, async (submission) => {
+          const prolificId = submission['Participant id'];
           try {
-            participant = await prisma.participant.create({
-              data: {
-                prolificId: submission['Participant id'],
-                sessionId: `prolific_${submission['Participant id']}_${experiment.id}_${Date.now()}`,
-                experimentId: experiment.id,
-                status: submission['Status'].toLowerCase(),
-                assignedTwoVideoComparisonTasks: [],
-                metadata: {
-                  demographics: participantInfo || null,
-                  prolificSubmissionId: submission['Submission id'],
-                  submissionStatus: submission['Status'],
-                  completedDateTime: submission['Completed at'],
-                  startedDateTime: submission['Started at'],
-                  studyCode: submission['Study code'],
-                  reward: study.reward,
-                  submissionReward: submission['Reward'] ? Number(submission['Reward']) : undefined,
-                  timeTaken: submission['Time taken'] ? Number(submission['Time taken']) : undefined,
-                  isComplete: submission['Is complete'] === 'true' || submission['Is complete'] === '1',
-                  bonusPayments: submission['Bonus payments']
-                    ? (() => {
-                        try {
-                          const parsed = JSON.parse(submission['Bonus payments']);
-                          return Array.isArray(parsed) ? parsed.map(Number) : [];
-                        } catch {
-                          return [];
-                        }
-                      })()
-                    : [],
-                  totalPayment:
-                    (study.reward || 0) +
-                    ((submission['Bonus payments']
-                      ? (() => {
-                          try {
-                            const parsed = JSON.parse(submission['Bonus payments']);
-                            return Array.isArray(parsed) ? parsed.reduce((a, b) => a + Number(b), 0) : 0;
-                          } catch {
-                            return 0;
-                          }
-                        })()
-                      : 0) || 0),
-                  lastSyncedAt: new Date().toISOString()
-                }
-              }
-            });
-          } catch (error: any) {
-            if (error.code === 'P2002' && error.meta?.target?.includes('prolificId')) {
-              // Unique constraint violation - participant exists in another experiment
-              console.log(`⚠️  Participant ${submission['Participant id']} already exists in another experiment. Creating with unique session ID.`);
-              participant = await prisma.participant.create({
-                data: {
-                  prolificId: null, // Set to null to avoid unique constraint
-                  prolificSubmissionId: submission['Submission id'], // Use submission ID as alternative identifier
-                  sessionId: `prolific_${submission['Participant id']}_${experiment.id}_${Date.now()}`,
-                  experimentId: experiment.id,
-                  status: submission['Status'].toLowerCase(),
-                  assignedTwoVideoComparisonTasks: [],
-                  metadata: {
-                    originalProlificId: submission['Participant id'], // Store original ID in metadata
-                    demographics: participantInfo || null,
-                    prolificSubmissionId: submission['Submission id'],
-                    submissionStatus: submission['Status'],
-                    completedDateTime: submission['Completed at'],
-                    startedDateTime: submission['Started at'],
-                    studyCode: submission['Study code'],
-                    reward: study.reward,
-                    submissionReward: submission['Reward'] ? Number(submission['Reward']) : undefined,
-                    timeTaken: submission['Time taken'] ? Number(submission['Time taken']) : undefined,
-                    isComplete: submission['Is complete'] === 'true' || submission['Is complete'] === '1',
-                    bonusPayments: submission['Bonus payments']
-                      ? (() => {
-                          try {
-                            const parsed = JSON.parse(submission['Bonus payments']);
-                            return Array.isArray(parsed) ? parsed.map(Number) : [];
-                          } catch {
-                            return [];
-                          }
-                        })()
-                      : [],
-                    totalPayment:
-                      (study.reward || 0) +
-                      ((submission['Bonus payments']
-                        ? (() => {
-                            try {
-                              const parsed = JSON.parse(submission['Bonus payments']);
-                              return Array.isArray(parsed) ? parsed.reduce((a, b) => a + Number(b), 0) : 0;
-                            } catch {
-                              return 0;
-                            }
-                          })()
-                        : 0) || 0),
-                    lastSyncedAt: new Date().toISOString()
-                  }
-                }
+            try {
+              await prisma.participant.create({
+                data: buildCreateData(submission, takenProlificIds.has(prolificId))
               });
-            } else {
-              throw error; // Re-throw if it's not a unique constraint error
+            } catch (error: any) {
+              // Unique constraint violation - participant exists in another experiment
+              if (!(error.code === 'P2002' && error.meta?.target?.includes('prolificId'))) throw error;
+              await prisma.participant.create({ data: buildCreateData(submission, true) });
             }
+            syncedParticipants++;
+            console.log(`✓ Created participant ${prolificId}`);
+          } catch (error) {
+            console.error(`Failed to create participant ${prolificId}:`, error);
           }
-        }
+        });
+      }
+    }
 
+    // Update existing participants through a small pool of workers so the
+    // per-participant round trips overlap instead of running one by one
+    const updateParticipant = async ({ participantId, submission }: typeof updates[number]) => {
+      try {
+        await prisma.participant.update({
+          where: { id: participantId },
+          data: {
+            status: submission['Status'].toLowerCase(),
+            metadata: this.buildParticipantMetadata(submission, study, syncedAt)
+          }
+        });
 
         syncedParticipants++;
         console.log(`✓ Synced participant ${submission['Participant id']}`);
       } catch (error) {
         console.error(`Failed to sync participant ${submission['Participant id']}:`, error);
       }
-    }
+    };
+
+    await mapWithConcurrency(updates, SYNC_CONCURRENCY, updateParticipant);
 
     // Auto-update experiment status based on Prolific study status using smart status management
     const statusUpdate = shouldUpdateExperimentStatus(
@@ -1,21 +1,47 @@
-import { S3Client, PutObjectCommand, GetObjectCommand } from '@aws-sdk/client-s3'
+import {
+  S3Client,
+  S3ClientConfig,
+  PutObjectCommand,
+  GetObjectCommand,
+  CreateMultipartUploadCommand,
+  UploadPartCommand,
+  CompleteMultipartUploadCommand,
+  AbortMultipartUploadCommand,
+  CompletedPart,
+  ObjectCannedACL,
+} from '@aws-sdk/client-s3'
 import { getSignedUrl } from '@aws-sdk/s3-request-presigner'
+import { Agent } from 'https'
+import { mapWithConcurrency } from './utils/concurrency'
 
 
+// Client settings shared by the web app and the CLI scripts, which build their
+// own S3Client from this config (see scripts/s3-client.ts)
+export function getTigrisClientConfig(): S3ClientConfig {
+  return {
+    endpoint: process.env.AWS_ENDPOINT_URL_S3 || 'https://fly.storage.tigris.dev',
+    region: process.env.AWS_REGION || 'auto',
+    credentials: {
+      accessKeyId: process.env.AWS_ACCESS_KEY_ID!,
+      secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY!,
+    },
+    // Keep TLS connections alive between requests with room for concurrent
+    // multipart parts from several uploads, and back off adaptively (client
+    // side rate limiting) instead of retrying at full speed when throttled
+    maxAttempts: 5,
+    retryMode: 'adaptive',
+    requestHandler: {
+      httpsAgent: new Agent({ keepAlive: true, maxSockets: 64 }),
+    },
+  };
+}
+
 // Lazy initialization of Tigris client to ensure environment variables are loaded
 let tigrisClient: S3Client | null = null;
 
 function getTigrisClient(): S3Client {
   if (!tigrisClient) {
-    
-    tigrisClient = new S3Client({
-      endpoint: process.env.AWS_ENDPOINT_URL_S3 || 'https://fly.storage.tigris.dev',
-      region: process.env.AWS_REGION || 'auto',
-      credentials: {
-        accessKeyId: process.env.AWS_ACCESS_KEY_ID!,
-        secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY!,
-      },
-    });
+    tigrisClient = new S3Client(getTigrisClientConfig());
   }
   return tigrisClient;
 }
@@ -27,6 +53,82 @@ export function getBucketName(): string {
   return process.env.TIGRIS_BUCKET_NAME;
 }
 
+// Objects at or above the threshold are uploaded in parts, several in flight
+// at once, instead of as one single-stream PutObject
+export const MULTIPART_THRESHOLD = 16 * 1024 * 1024;
+export const MULTIPART_PART_SIZE = 8 * 1024 * 1024;
+export const MULTIPART_CONCURRENCY = 8;
+
+export interface MultipartUploadOptions {
+  bucketName: string;
+  key: string;
+  size: number;
+  contentType: string;
+  acl?: ObjectCannedACL;
+  // Returns bytes [start, end) of the object. Only MULTIPART_CONCURRENCY parts
+  // are requested at a time, so callers can read them lazily (e.g. from disk)
+  readPart: (start: number, end: number) => Buffer | Promise<Buffer>;
+  onPartUploaded?: (bytes: number) => void;
+}
+
+export async function uploadMultipart({
+  bucketName,
+  key,
+  size,
+  contentType,
+  acl,
+  readPart,
+  onPartUploaded,
+}: MultipartUploadOptions): Promise<void> {
+  const client = getTigrisClient();
+  const { UploadId } = await client.send(new CreateMultipartUploadCommand({
+    Bucket: bucketName,
+    Key: key,
+    ContentType: contentType,
+    ACL: acl,
+  }));
+
+  const partNumbers = Array.from(
+    { length: Math.ceil(size / MULTIPART_PART_SIZE) },
+    (_, index) => index + 1
+  );
+
+  try {
+    const parts = await mapWithConcurrency(
+      partNumbers,
+      MULTIPART_CONCURRENCY,
+      async (partNumber): Promise<CompletedPart> => {
+        const start = (partNumber - 1) * MULTIPART_PART_SIZE;
+        const end = Math.min(start + MULTIPART_PART_SIZE, size);
+        const { ETag } = await client.send(new UploadPartCommand({
+          Bucket: bucketName,
+          Key: key,
+          UploadId,
+          PartNumber: partNumber,
+          Body: await readPart(start, end),
+        }));
+        onPartUploaded?.(end - start);
+        return { ETag, PartNumber: partNumber };
+      }
+    );
+
+    await client.send(new CompleteMultipartUploadCommand({
+      Bucket: bucketName,
+      Key: key,
+      UploadId,
+      MultipartUpload: { Parts: parts },
+    }));
+  } catch (error) {
+    // Don't leave orphaned parts behind in the bucket
+    await client.send(new AbortMultipartUploadCommand({
+      Bucket: bucketName,
+      Key: key,
+      UploadId,
+    })).catch(() => {});
+    throw error;
+  }
+}
+
 export async function uploadVideoToTigris(
   file: Buffer,
   key: string,
@@ -34,15 +136,26 @@ export async function uploadVideoToTigris(
 ): Promise<string> {
   const bucketName = getBucketName();
   
-  const command = new PutObjectCommand({
-    Bucket: bucketName,
-    Key: key,
-    Body: file,
-    ContentType: contentType,
-    // Remove ACL - Tigris handles public access differently
-  });
+  if (file.length >= MULTIPART_THRESHOLD) {
+    await uploadMultipart({
+      bucketName,
+      key,
+      size: file.length,
+      contentType,
+      // subarray is a view, so parts don't copy the video buffer
+      readPart: (start, end) => file.subarray(start, end),
+    });
+  } else {
+    const command = new PutObjectCommand({
+      Bucket: bucketName,
+      Key: key,
+      Body: file,
+      ContentType: contentType,
+      // Remove ACL - Tigris handles public access differently
+    });
 
-  await getTigrisClient().send(command);
+    await getTigrisClient().send(command);
+  }
 
   // Return public URL - make sure to use the correct format for Tigris
   const endpoint = `https://${bucketName}.fly.storage.tigris.dev`
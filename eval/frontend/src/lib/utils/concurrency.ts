@@ -0,0 +1,32 @@
+// Utility functions for running async work through a bounded pool of workers
+
+// Run fn over items with at most `limit` calls in flight, preserving result order.
+// Once a call rejects no further items are started; the calls already in
+// flight are left to settle before the first rejection is thrown, so callers
+// can safely clean up (abort an upload, close a file) when this rejects
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  let failed = false;
+  let firstError: unknown;
+  const worker = async () => {
+    while (!failed && next < items.length) {
+      const index = next++;
+      try {
+        results[index] = await fn(items[index], index);
+      } catch (error) {
+        if (!failed) {
+          failed = true;
+          firstError = error;
+        }
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  if (failed) throw firstError;
+  return results;
+}
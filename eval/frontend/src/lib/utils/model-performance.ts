@@ -0,0 +1,77 @@
+// Utility functions for turning two-video comparison submissions into per-model win rates
+
+export interface ModelPerformance {
+  model: string;
+  dimension: string;
+  win_rate: number;
+  num_twoVideoComparisonSubmissions: number;
+}
+
+export interface ComparisonSubmissionScores {
+  dimensionScores: unknown;
+  twoVideoComparisonTask: {
+    modelA: string;
+    modelB: string;
+  };
+}
+
+export function calculateModelPerformance(submissions: ComparisonSubmissionScores[]): ModelPerformance[] {
+  const modelStats = new Map<string, Map<string, { wins: number; total: number }>>();
+
+  const getStats = (model: string, dimension: string) => {
+    let dimensions = modelStats.get(model);
+    if (!dimensions) {
+      dimensions = new Map();
+      modelStats.set(model, dimensions);
+    }
+    let stats = dimensions.get(dimension);
+    if (!stats) {
+      stats = { wins: 0, total: 0 };
+      dimensions.set(dimension, stats);
+    }
+    return stats;
+  };
+
+  for (const submission of submissions) {
+    const dimensionScores = submission.dimensionScores as Record<string, string> | null;
+    if (!dimensionScores) continue;
+
+    const { modelA, modelB } = submission.twoVideoComparisonTask;
+
+    for (const [dimension, choice] of Object.entries(dimensionScores)) {
+      const statsA = getStats(modelA, dimension);
+      const statsB = getStats(modelB, dimension);
+
+      // Count wins based on chosen model (A or B); ties are 0.5 wins for both
+      if (choice === 'A') {
+        statsA.wins += 1;
+      } else if (choice === 'B') {
+        statsB.wins += 1;
+      } else if (choice === 'tie') {
+        statsA.wins += 0.5;
+        statsB.wins += 0.5;
+      } else {
+        continue;
+      }
+      statsA.total += 1;
+      statsB.total += 1;
+    }
+  }
+
+  const performance: ModelPerformance[] = [];
+
+  modelStats.forEach((dimensions, model) => {
+    dimensions.forEach((stats, dimension) => {
+      if (stats.total > 0) {
+        performance.push({
+          model,
+          dimension,
+          win_rate: stats.wins / stats.total,
+          num_twoVideoComparisonSubmissions: stats.total
+        });
+      }
+    });
+  });
+
+  return performance;
+}
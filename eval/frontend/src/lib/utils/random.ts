@@ -0,0 +1,15 @@
+// Utility functions for reproducible randomness
+
+// Small seeded PRNG (mulberry32) so the same seed always produces the same
+// sequence in [0, 1); without a seed fall back to Math.random
+export function createRandom(seed?: number | null): () => number {
+  if (seed === undefined || seed === null) return Math.random
+  let state = seed >>> 0
+  return () => {
+    state = (state + 0x6D2B79F5) >>> 0
+    let t = state
+    t = Math.imul(t ^ (t >>> 15), t | 1)
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61)
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+  }
+}
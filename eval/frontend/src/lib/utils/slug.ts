@@ -55,21 +55,60 @@ export async function generateUniqueSlug(baseSlug: string, tableName: string): P
   // In a real implementation, you'd check the database for uniqueness
   const { prisma } = await import('@/lib/prisma')
   
-  let slug = slugify(baseSlug)
-  let counter = 1
+  const slug = slugify(baseSlug)
+  
+  // Fetch every slug sharing the prefix in one query and pick the first free
+  // candidate locally, instead of one findUnique per attempted suffix
+  const taken = new Set<string>(
+    (await (prisma as any)[tableName].findMany({
+      where: { slug: { startsWith: slug } },
+      select: { slug: true }
+    })).map((row: { slug: string }) => row.slug)
+  )
   
+  let counter = 1
   while (true) {
     const testSlug = counter === 1 ? slug : `${slug}-${counter}`
     
-    // Check if slug exists in the specified table
-    const exists = await (prisma as any)[tableName].findUnique({
-      where: { slug: testSlug }
-    })
-    
-    if (!exists) {
+    if (!taken.has(testSlug)) {
       return testSlug
     }
     
     counter++
   }
-}
\ No newline at end of file
+}
+
+/**
+ * Check whether an error is a Prisma unique constraint violation on a slug
+ */
+export function isSlugConflict(error: unknown): boolean {
+  const { code, meta } = (error ?? {}) as { code?: string; meta?: { target?: unknown } }
+  if (code !== 'P2002') return false
+  
+  // target lists the conflicting fields (or names the constraint on some drivers)
+  const target = meta?.target
+  const targets: unknown[] = Array.isArray(target) ? target : [target]
+  return targets.some(field => typeof field === 'string' && field.includes('slug'))
+}
+
+/**
+ * Create a record under a unique slug derived from baseSlug
+ */
+export async function createWithUniqueSlug<T>(
+  baseSlug: string,
+  tableName: string,
+  create: (slug: string) => Promise<T>
+): Promise<T> {
+  // Taken slugs are looked up in one query first, so the create (and any nested
+  // writes it carries) normally goes out once. Only a slug claimed between the
+  // lookup and the insert is rejected by the unique constraint, and then the
+  // next free slug is picked and the create retried
+  while (true) {
+    const slug = await generateUniqueSlug(baseSlug, tableName)
+    try {
+      return await create(slug)
+    } catch (error) {
+      if (!isSlugConflict(error)) throw error
+    }
+  }
+}
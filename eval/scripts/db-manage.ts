@@ -10,6 +10,7 @@ import chalk from 'chalk';
 import * as dotenv from 'dotenv';
 import * as path from 'path';
 import { prisma } from './prisma-client';
+import { MAIN_TABLES, countTables, writeJsonRows } from './db-utils';
 
 // Load environment variables
 dotenv.config({ path: path.join(__dirname, '../frontend/.env.local') });
@@ -77,15 +78,15 @@ program
         const result = await prisma.$queryRawUnsafe(`SELECT COUNT(*) as count FROM "${options.table}"`);
         console.log(chalk.blue(`📊 ${options.table}:`), chalk.yellow(`${(result as any)[0].count} records`));
       } else {
-        const tables = ['Experiment', 'Comparison', 'Evaluation', 'Video', 'Participant'];
         console.log(chalk.blue.bold('\n📊 Record Counts\n'));
         
-        for (const table of tables) {
-          try {
-            const result = await prisma.$queryRawUnsafe(`SELECT COUNT(*) as count FROM "${table}"`);
-            console.log(chalk.white(`${table}:`), chalk.yellow(`${(result as any)[0].count} records`));
-          } catch (error) {
+        const counts = await countTables(MAIN_TABLES);
+        for (const table of MAIN_TABLES) {
+          const count = counts.get(table);
+          if (count == null) {
             console.log(chalk.white(`${table}:`), chalk.red('Error'));
+          } else {
+            console.log(chalk.white(`${table}:`), chalk.yellow(`${count} records`));
           }
         }
       }
@@ -162,7 +163,7 @@ program
       
       if (Array.isArray(result) && result.length > 0) {
         if (options.format === 'json') {
-          console.log(JSON.stringify(result, null, 2));
+          writeJsonRows(result);
         } else {
           // Simple table format
           console.log(chalk.blue.bold('\n📋 Query Results\n'));
@@ -0,0 +1,63 @@
+import { prisma } from './prisma-client';
+
+// Helpers shared by the database CLI commands (db-manage, evalctl db:*)
+
+// Tables reported by the record count commands, by their database names
+export const MAIN_TABLES = [
+  'Experiment',
+  'TwoVideoComparisonTask',
+  'TwoVideoComparisonSubmission',
+  'SingleVideoEvaluationTask',
+  'SingleVideoEvaluationSubmission',
+  'Participant',
+  'Video',
+  'organizations',
+  'organization_members'
+];
+
+// Count the rows of every table in one round trip. Table names are
+// interpolated into the SQL, so callers must pass a fixed list, never user
+// input. Tables that can't be counted (e.g. missing ones) map to null
+export async function countTables(tables: string[]): Promise<Map<string, number | null>> {
+  try {
+    const rows = await prisma.$queryRawUnsafe<{ table_name: string; count: bigint }[]>(
+      tables
+        .map(table => `SELECT '${table}' AS table_name, COUNT(*) AS count FROM "${table}"`)
+        .join(' UNION ALL ')
+    );
+    return new Map(rows.map(row => [row.table_name, Number(row.count)]));
+  } catch {
+    // One missing table fails the whole UNION; fall back to per-table counts
+  }
+
+  const counts = new Map<string, number | null>();
+  for (const table of tables) {
+    try {
+      const rows = await prisma.$queryRawUnsafe<{ count: bigint }[]>(`SELECT COUNT(*) AS count FROM "${table}"`);
+      counts.set(table, Number(rows[0].count));
+    } catch {
+      counts.set(table, null);
+    }
+  }
+  return counts;
+}
+
+// Raw queries return BigInt for COUNT(*) and similar, which JSON.stringify rejects
+export function jsonReplacer(_key: string, value: unknown) {
+  return typeof value === 'bigint' ? value.toString() : value;
+}
+
+// Write rows as a JSON array one row per line, flushing in chunks so large
+// result sets are not serialized into a single giant string first
+export function writeJsonRows(rows: unknown[], chunkSize = 1000) {
+  process.stdout.write('[\n');
+  for (let start = 0; start < rows.length; start += chunkSize) {
+    const end = Math.min(start + chunkSize, rows.length);
+    let chunk = '';
+    for (let i = start; i < end; i++) {
+      chunk += '  ' + JSON.stringify(rows[i], jsonReplacer) + (i < rows.length - 1 ? ',\n' : '\n');
+    }
+    process.stdout.write(chunk);
+  }
+  process.stdout.write(']\n');
+}
@@ -15,13 +15,13 @@ import * as path from 'path';
 import chalk from 'chalk';
 
 import { generateSlug, isValidSlug, slugify } from '../frontend/src/lib/utils/slug';
+import { mapWithConcurrency } from '../frontend/src/lib/utils/concurrency';
 import { requireAuth, clearAuth } from './auth';
 import { prisma } from './prisma-client';
-import { prolificService } from '../frontend/src/lib/services/prolific';
+import { MAIN_TABLES, countTables, writeJsonRows } from './db-utils';
 // Don't import ExperimentService - it uses frontend prisma client
 // import { ExperimentService } from '../frontend/src/lib/experiment-service';
 import { getUserOrganizations } from './cli-organization';
-import { uploadVideoToTigris } from '../frontend/src/lib/storage';
 
 // Show environment info for non-help commands
 const isHelpCommand = process.argv.includes('--help') || process.argv.includes('-h');
@@ -36,6 +36,36 @@ if (!process.env.DATABASE_URL) {
   process.exit(1);
 }
 
+// The Prolific service pulls in the frontend Prisma client and CSV parser,
+// so only load it for the commands that actually talk to Prolific
+async function getProlificService() {
+  const { prolificService } = await import('../frontend/src/lib/services/prolific');
+  return prolificService.instance;
+}
+
+// lib/storage pulls in the AWS SDK client and presigner, so only load it for
+// the commands that touch object storage
+async function loadStorage() {
+  return import('../frontend/src/lib/storage');
+}
+
+// Participant statuses that count towards an experiment's totals: Prolific
+// experiments only count approved participants, others count
+// active/completed/approved. Expressed as a relation filter so it is evaluated
+// in the same query as the counts
+const participantStatusByExperimentType = {
+  OR: [
+    {
+      experiment: { prolificStudyId: { not: null } },
+      status: { in: ['approved'] }
+    },
+    {
+      experiment: { prolificStudyId: null },
+      status: { in: ['active', 'completed', 'approved'] }
+    }
+  ]
+};
+
 // Get base URL for API calls - automatically determined by EVALCTL_ENV
 function getBaseUrl(): string {
   return process.env.NEXT_PUBLIC_APP_URL || 
@@ -236,36 +266,10 @@ program
       try {
         const organizationId = await selectOrganization(auth);
         
-        // Get experiments first to check which have Prolific integration
-        const experimentsForFilter = await prisma.experiment.findMany({
-          where: {
-            organizationId,
-            archived: false,
-            ...(options.group && { group: options.group }),
-          },
-          select: {
-            id: true,
-            prolificStudyId: true
-          }
-        });
-        
         // Build participant filter based on includeAnonymous setting and Prolific integration
-        // For Prolific experiments, only count approved participants
-        // For non-Prolific experiments, count active/completed/approved participants
         const participantFilter = options.includeAnonymous ? {
           AND: [
-            {
-              OR: experimentsForFilter.map(exp => ({
-                AND: [
-                  { experimentId: exp.id },
-                  {
-                    status: {
-                      in: exp.prolificStudyId ? ['approved'] : ['active', 'completed', 'approved']
-                    }
-                  }
-                ]
-              }))
-            },
+            participantStatusByExperimentType,
             {
               OR: [
                 { prolificId: { not: null } },  // Prolific participants
@@ -282,18 +286,7 @@ program
                 }
               }
             },
-            {
-              OR: experimentsForFilter.map(exp => ({
-                AND: [
-                  { experimentId: exp.id },
-                  {
-                    status: {
-                      in: exp.prolificStudyId ? ['approved'] : ['active', 'completed', 'approved']
-                    }
-                  }
-                ]
-              }))
-            },
+            participantStatusByExperimentType,
             {
               prolificId: { not: null }  // Only Prolific participants, exclude anonymous
             }
@@ -514,32 +507,6 @@ program
   .action(async (slug) => {
     await requireAuth('view experiment stats', async () => {
       try {
-        // First get experiment to check if it has Prolific integration
-        const baseExperiment = await prisma.experiment.findUnique({
-          where: { slug },
-          select: {
-            id: true,
-            name: true,
-            status: true,
-            evaluationMode: true,
-            prolificStudyId: true,
-            config: true,
-            createdAt: true,
-            startedAt: true,
-            completedAt: true
-          }
-        });
-        
-        if (!baseExperiment) {
-          console.log(chalk.red('Experiment not found'));
-          return;
-        }
-        
-        // Determine participant status filter based on Prolific integration
-        const participantStatusFilter = baseExperiment.prolificStudyId 
-          ? ['approved']  // For Prolific experiments, only count approved
-          : ['active', 'completed', 'approved'];  // For non-Prolific experiments, count all valid statuses
-        
         const experiment = await prisma.experiment.findUnique({
         where: { slug },
         include: {
@@ -550,11 +517,7 @@ program
               participants: {
                 where: {
                   AND: [
-                    {
-                      status: {
-                        in: participantStatusFilter
-                      }
-                    },
+                    participantStatusByExperimentType,
                     {
                       prolificId: { not: null }  // Only Prolific participants, exclude anonymous
                     }
@@ -564,18 +527,6 @@ program
               twoVideoComparisonSubmissions: true,
               singleVideoEvaluationSubmissions: true,
             }
-          },
-          twoVideoComparisonSubmissions: {
-            select: {
-              dimensionScores: true,
-              completionTimeSeconds: true,
-            }
-          },
-          singleVideoEvaluationSubmissions: {
-            select: {
-              dimensionScores: true,
-              completionTimeSeconds: true,
-            }
           }
         }
       });
@@ -601,14 +552,14 @@ program
             chalk.yellow(avgEvaluationsPerTask.toFixed(2)));
         }
         
-        if (experiment.singleVideoEvaluationSubmissions.length > 0) {
-          const avgCompletionTime = experiment.singleVideoEvaluationSubmissions
-            .filter(e => e.completionTimeSeconds)
-            .reduce((sum, e) => sum + (e.completionTimeSeconds || 0), 0) / 
-            experiment.singleVideoEvaluationSubmissions.filter(e => e.completionTimeSeconds).length;
-          
+        const { _avg } = await prisma.singleVideoEvaluationSubmission.aggregate({
+          where: { experimentId: experiment.id, completionTimeSeconds: { gt: 0 } },
+          _avg: { completionTimeSeconds: true }
+        });
+        
+        if (_avg.completionTimeSeconds !== null) {
           console.log(chalk.white('Avg Completion Time:'), 
-            chalk.yellow(`${(avgCompletionTime / 60).toFixed(1)} minutes`));
+            chalk.yellow(`${(_avg.completionTimeSeconds / 60).toFixed(1)} minutes`));
         }
       } else {
         console.log(chalk.white('Total Two Video Comparison Tasks:'), chalk.yellow(experiment._count.twoVideoComparisonTasks));
@@ -621,14 +572,14 @@ program
             chalk.yellow(avgEvaluationsPerComparison.toFixed(2)));
         }
         
-        if (experiment.twoVideoComparisonSubmissions.length > 0) {
-          const avgCompletionTime = experiment.twoVideoComparisonSubmissions
-            .filter(e => e.completionTimeSeconds)
-            .reduce((sum, e) => sum + (e.completionTimeSeconds || 0), 0) / 
-            experiment.twoVideoComparisonSubmissions.filter(e => e.completionTimeSeconds).length;
-          
+        const { _avg } = await prisma.twoVideoComparisonSubmission.aggregate({
+          where: { experimentId: experiment.id, completionTimeSeconds: { gt: 0 } },
+          _avg: { completionTimeSeconds: true }
+        });
+        
+        if (_avg.completionTimeSeconds !== null) {
           console.log(chalk.white('Avg Completion Time:'), 
-            chalk.yellow(`${(avgCompletionTime / 60).toFixed(1)} minutes`));
+            chalk.yellow(`${(_avg.completionTimeSeconds / 60).toFixed(1)} minutes`));
         }
       }
         
@@ -834,9 +785,12 @@ program
   .description('Upload videos from a directory to the video library')
   .option('-d, --dir <directory>', 'Directory containing video files to upload')
   .option('-m, --model <model>', 'Model name to associate with uploaded videos')
+  .option('-c, --concurrency <n>', 'Number of videos to upload in parallel', '4')
+  .option('--skip-existing', 'Skip files whose content is already in the video library')
   .action(async (options) => {
     await requireAuth('upload videos', async (auth) => {
       const { spawn } = require('child_process');
+      const crypto = require('crypto');
       const fs = require('fs');
       const path = require('path');
 
@@ -857,31 +811,94 @@ program
         }
 
         // Get all video files from directory
-        const videoExtensions = ['.mp4', '.mov', '.avi', '.mkv', '.webm'];
-        const videoFiles = fs.readdirSync(videoDir)
-          .filter((file: string) => videoExtensions.some(ext => file.toLowerCase().endsWith(ext)))
-          .map((file: string) => path.join(videoDir, file));
+        // withFileTypes lets us skip subdirectories without a stat per entry
+        // (symlinks are kept, as they usually point at video files), and the
+        // extension check is a single Set lookup per file
+        const videoExtensions = new Set(['.mp4', '.mov', '.avi', '.mkv', '.webm']);
+        const videoFiles = fs.readdirSync(videoDir, { withFileTypes: true })
+          .filter((entry: any) => (entry.isFile() || entry.isSymbolicLink()) && videoExtensions.has(path.extname(entry.name).toLowerCase()))
+          .map((entry: any) => path.join(videoDir, entry.name));
 
         if (videoFiles.length === 0) {
           console.error(chalk.red(`❌ No video files found in: ${videoDir}`));
           process.exit(1);
         }
 
+        const concurrency = Math.max(1, parseInt(options.concurrency) || 4);
+
         console.log(chalk.blue(`📁 Found ${videoFiles.length} video files in ${videoDir}`));
-        console.log(chalk.blue(`🚀 Starting upload...\n`));
+        console.log(chalk.blue(`🚀 Starting upload (${concurrency} at a time)...\n`));
 
         // Get organization once for all uploads
         const organizationId = await selectOrganization(auth);
-        const results: any[] = [];
+        const { uploadVideoToTigris } = await loadStorage();
+
+        // Content hashes already in the library (and uploaded earlier in this
+        // run), so identical files are uploaded once
+        const knownHashes = new Set<string>();
+        // Uploads still in flight, by content hash. A duplicate waits for the
+        // first copy and is only skipped if that upload succeeded
+        const pendingHashes = new Map<string, Promise<void>>();
+        if (options.skipExisting) {
+          const existingVideos = await prisma.video.findMany({
+            where: { organizationId },
+            select: { metadata: true }
+          });
+          for (const video of existingVideos) {
+            const sha256 = (video.metadata as any)?.sha256;
+            if (sha256) knownHashes.add(sha256);
+          }
+        }
+
+        // Video records are saved in small batches as uploads complete, so an
+        // interruption loses at most one batch of records, and a batch that
+        // fails is retried row by row so one bad record doesn't fail the rest
+        const recordBatchSize = 25;
+        let pendingRecords: any[] = [];
+
+        async function saveRecords(batch: any[]) {
+          try {
+            await prisma.video.createMany({
+              data: batch.map(r => r.record)
+            });
+          } catch {
+            for (const result of batch) {
+              try {
+                await prisma.video.create({ data: result.record });
+              } catch (error) {
+                console.error(chalk.red(`❌ Failed to save video record for ${result.fileName}: ${error}`));
+                result.success = false;
+                result.error = 'Failed to save video record';
+              }
+            }
+          }
+        }
 
         // Upload function using existing web UI functions
         async function uploadVideo(filePath: string): Promise<any> {
           const fileName = path.basename(filePath);
           console.log(chalk.gray(`📤 Uploading: ${fileName}`));
+          let claimedHash: string | undefined;
+          let releaseHash = () => {};
           
           try {
-            // Read file as buffer (same as web UI)
-            const fileBuffer = fs.readFileSync(filePath);
+            // Read file as buffer (same as web UI). Use the async read so one
+            // worker's disk I/O doesn't block the other workers' uploads
+            const fileBuffer = await fs.promises.readFile(filePath);
+            const sha256 = crypto.createHash('sha256').update(fileBuffer).digest('hex');
+
+            if (options.skipExisting) {
+              let pending;
+              while ((pending = pendingHashes.get(sha256))) {
+                await pending;
+              }
+              if (knownHashes.has(sha256)) {
+                console.log(chalk.yellow(`⏭️  Skipping (already uploaded): ${fileName}`));
+                return { success: true, skipped: true, fileName };
+              }
+              claimedHash = sha256;
+              pendingHashes.set(sha256, new Promise<void>(resolve => { releaseHash = resolve; }));
+            }
             
             // Generate key for video library (same logic as web UI route)
             const fileExtension = fileName.split('.').pop() || 'mp4';
@@ -891,10 +908,16 @@ program
             
             // Upload to Tigris using existing function
             const videoUrl = await uploadVideoToTigris(fileBuffer, key, 'video/mp4');
+            knownHashes.add(sha256);
 
-            // Save video record to database (same as web UI route)
-            const video = await prisma.video.create({
-              data: {
+            console.log(chalk.green(`✅ Uploaded: ${fileName}`));
+            const result = {
+              success: true,
+              fileName,
+              url: videoUrl,
+              key,
+              // Video record (same as web UI route), inserted with its batch
+              record: {
                 key,
                 name: fileName,
                 url: videoUrl,
@@ -907,19 +930,19 @@ program
                   originalName: fileName,
                   mimeType: 'video/mp4',
                   uploadedBy: auth.userId || 'cli-user',
-                  modelName: options.model || null
+                  modelName: options.model || null,
+                  sha256
                 }
               }
-            });
-            
-            console.log(chalk.green(`✅ Uploaded: ${fileName}`));
-            return {
-              success: true,
-              fileName,
-              url: videoUrl,
-              key,
-              id: video.id
             };
+
+            pendingRecords.push(result);
+            if (pendingRecords.length >= recordBatchSize) {
+              const batch = pendingRecords;
+              pendingRecords = [];
+              await saveRecords(batch);
+            }
+            return result;
             
           } catch (error) {
             console.error(chalk.red(`❌ Failed to upload ${fileName}: ${error}`));
@@ -928,24 +951,36 @@ program
               fileName,
               error: error.message || 'Upload failed'
             };
+          } finally {
+            if (claimedHash) {
+              pendingHashes.delete(claimedHash);
+              releaseHash();
+            }
           }
         }
 
-        // Upload all videos sequentially
-        for (const filePath of videoFiles) {
-          const result = await uploadVideo(filePath);
-          results.push(result);
-          
-          // Small delay between uploads to avoid overwhelming the server
-          await new Promise(resolve => setTimeout(resolve, 500));
+        // Upload videos through a bounded pool so per-file latency overlaps
+        // without opening an unbounded number of connections
+        const results = await mapWithConcurrency(videoFiles, concurrency, uploadVideo);
+
+        // Save the records of the last, partial batch
+        if (pendingRecords.length > 0) {
+          await saveRecords(pendingRecords);
+        }
+        if (results.some(r => r.error === 'Failed to save video record')) {
+          console.log(chalk.gray('Files without a record are in storage; run ./evalctl sync-videos to recreate the records'));
         }
 
         // Summary
-        const successful = results.filter(r => r.success);
+        const successful = results.filter(r => r.success && !r.skipped);
+        const skipped = results.filter(r => r.skipped);
         const failed = results.filter(r => !r.success);
 
         console.log(chalk.blue.bold(`\n📊 Upload Summary:`));
         console.log(chalk.green(`✅ Successful: ${successful.length}`));
+        if (skipped.length > 0) {
+          console.log(chalk.yellow(`⏭️  Skipped (duplicate content): ${skipped.length}`));
+        }
         console.log(chalk.red(`❌ Failed: ${failed.length}`));
 
         if (successful.length > 0) {
@@ -979,32 +1014,28 @@ program
   .option('--dry-run', 'Show what would be synced without making changes')
   .action(async (options) => {
     await requireAuth('sync video library', async (auth) => {
-      const { S3Client, ListObjectsV2Command } = require('@aws-sdk/client-s3');
+      const { paginateListObjectsV2 } = require('@aws-sdk/client-s3');
       
       try {
         console.log(chalk.blue.bold('\n🔄 Syncing Video Library with Tigris Storage\n'));
         
-        // Initialize Tigris client (same config as web UI)
-        const tigrisClient = new S3Client({
-          endpoint: process.env.AWS_ENDPOINT_URL_S3 || 'https://fly.storage.tigris.dev',
-          region: process.env.AWS_REGION || 'auto',
-          credentials: {
-            accessKeyId: process.env.AWS_ACCESS_KEY_ID!,
-            secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY!,
-          },
-        });
+        // Same config as the web UI, but built from this package's SDK so it
+        // matches the paginator above
+        const { getS3Client } = await import('./s3-client');
+        const tigrisClient = getS3Client();
 
         const bucketName = process.env.TIGRIS_BUCKET_NAME || 'eval-data';
         
         // List all video-library objects in Tigris
         console.log(chalk.gray('📋 Fetching videos from Tigris storage...'));
-        const listCommand = new ListObjectsV2Command({
+        const tigrisVideos: any[] = [];
+        const pages = paginateListObjectsV2({ client: tigrisClient }, {
           Bucket: bucketName,
           Prefix: 'video-library/',
         });
-        
-        const tigrisResponse = await tigrisClient.send(listCommand);
-        const tigrisVideos = tigrisResponse.Contents || [];
+        for await (const page of pages) {
+          tigrisVideos.push(...(page.Contents || []));
+        }
         
         console.log(chalk.blue(`Found ${tigrisVideos.length} videos in Tigris storage`));
         
@@ -1080,17 +1111,17 @@ program
             console.log(chalk.yellow('\n➕ Creating missing database records...'));
             const organizationId = await selectOrganization(auth);
             
-            for (const obj of missingDbRecords) {
-              const key = obj.Key!;
-              const fileName = key.split('/').pop()?.split('_').slice(1).join('_') || 'unknown';
-              const bucketName = process.env.TIGRIS_BUCKET_NAME || 'eval-data';
-              const videoUrl = `https://${bucketName}.fly.storage.tigris.dev/${key}`;
-              
-              await prisma.video.create({
-                data: {
+            const syncedAt = new Date().toISOString();
+            
+            const createResult = await prisma.video.createMany({
+              data: missingDbRecords.map(obj => {
+                const key = obj.Key!;
+                const fileName = key.split('/').pop()?.split('_').slice(1).join('_') || 'unknown';
+                
+                return {
                   key,
                   name: fileName,
-                  url: videoUrl,
+                  url: `https://${bucketName}.fly.storage.tigris.dev/${key}`,
                   size: obj.Size || 0,
                   organizationId,
                   tags: [],
@@ -1099,12 +1130,13 @@ program
                     originalName: fileName,
                     mimeType: 'video/mp4',
                     uploadedBy: 'sync-command',
-                    syncedAt: new Date().toISOString()
+                    syncedAt
                   }
-                }
-              });
-            }
-            console.log(chalk.green(`✅ Created ${missingDbRecords.length} missing database records`));
+                };
+              }),
+              skipDuplicates: true
+            });
+            console.log(chalk.green(`✅ Created ${createResult.count} missing database records`));
           }
           
           console.log(chalk.green('\n🎉 Database successfully synced with Tigris storage!'));
@@ -1156,43 +1188,46 @@ program
         if (!options.dbOnly) {
           console.log(chalk.yellow('🧹 Deleting files from Tigris storage...'));
           
-          const { S3Client, ListObjectsV2Command, DeleteObjectCommand } = await import('@aws-sdk/client-s3');
-          const tigrisClient = new S3Client({
-            endpoint: process.env.AWS_ENDPOINT_URL_S3 || 'https://fly.storage.tigris.dev',
-            region: process.env.AWS_REGION || 'auto',
-            credentials: {
-              accessKeyId: process.env.AWS_ACCESS_KEY_ID!,
-              secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY!,
-            },
-          });
+          const { paginateListObjectsV2, DeleteObjectsCommand } = await import('@aws-sdk/client-s3');
+          const { getS3Client } = await import('./s3-client');
+          const tigrisClient = getS3Client();
 
           const bucketName = process.env.TIGRIS_BUCKET_NAME;
           if (!bucketName) {
             throw new Error('TIGRIS_BUCKET_NAME environment variable is not set');
           }
           
-          // List all video-library objects
-          const listCommand = new ListObjectsV2Command({
+          // Walk all video-library objects; each page holds at most 1000 keys,
+          // which is also the DeleteObjects limit, so delete a page per request
+          const pages = paginateListObjectsV2({ client: tigrisClient }, {
             Bucket: bucketName,
             Prefix: 'video-library/',
           });
           
-          const response = await tigrisClient.send(listCommand);
-          const objects = response.Contents || [];
-          
-          console.log(chalk.blue(`Found ${objects.length} files to delete from storage`));
+          let failedFiles = 0;
+          for await (const page of pages) {
+            const keys = (page.Contents || [])
+              .filter(obj => obj.Key)
+              .map(obj => ({ Key: obj.Key! }));
+            if (keys.length === 0) continue;
+            
+            const deleteResult = await tigrisClient.send(new DeleteObjectsCommand({
+              Bucket: bucketName,
+              Delete: { Objects: keys, Quiet: true },
+            }));
+            
+            // In quiet mode only failures are reported back
+            const errors = deleteResult.Errors || [];
+            errors.forEach(err => {
+              console.log(chalk.red(`  ✗ Failed to delete ${err.Key}: ${err.Message}`));
+            });
+            failedFiles += errors.length;
+            deletedFiles += keys.length - errors.length;
+            console.log(chalk.gray(`  ✓ Deleted ${deletedFiles} files so far`));
+          }
           
-          // Delete each object
-          for (const obj of objects) {
-            if (obj.Key) {
-              const deleteCommand = new DeleteObjectCommand({
-                Bucket: bucketName,
-                Key: obj.Key,
-              });
-              await tigrisClient.send(deleteCommand);
-              deletedFiles++;
-              console.log(chalk.gray(`  ✓ Deleted: ${obj.Key}`));
-            }
+          if (failedFiles > 0) {
+            console.log(chalk.yellow(`⚠ ${failedFiles} files could not be deleted from storage`));
           }
         }
 
@@ -1298,10 +1333,19 @@ program
           });
         }
         
-        // Auto-discover available models from uploaded videos
-        const availableModels = Array.from(new Set(
-          videos.filter((v: any) => v.modelName).map((v: any) => v.modelName)
-        ));
+        // Auto-discover available models from uploaded videos, grouping the
+        // library by model in a single pass so later lookups are O(1)
+        const videosByModel = new Map<string, any[]>();
+        for (const video of videos) {
+          if (!video.modelName) continue;
+          const modelVideos = videosByModel.get(video.modelName);
+          if (modelVideos) {
+            modelVideos.push(video);
+          } else {
+            videosByModel.set(video.modelName, [video]);
+          }
+        }
+        const availableModels = Array.from(videosByModel.keys());
         
         if (availableModels.length === 0) {
           console.log(chalk.red('No videos with model names found in library.'));
@@ -1314,8 +1358,7 @@ program
         // Show video counts per model
         console.log(chalk.blue('\n📊 Videos available per model:'));
         availableModels.forEach(model => {
-          const modelVideos = videos.filter((v: any) => v.modelName === model);
-          console.log(chalk.white(`  ${model}: ${chalk.green(modelVideos.length)} videos`));
+          console.log(chalk.white(`  ${model}: ${chalk.green(videosByModel.get(model)!.length)} videos`));
         });
         
         // Ask user to select which model to evaluate
@@ -1342,7 +1385,7 @@ program
         console.log(chalk.green(`\n✅ Selected model: ${selectedModel}`));
         
         // Get all videos for the selected model
-        const modelVideos = videos.filter((v: any) => v.modelName === selectedModel);
+        const modelVideos = videosByModel.get(selectedModel) || [];
         console.log(chalk.white(`Found ${modelVideos.length} videos for ${selectedModel}`));
         
         const videoTasks: any[] = [];
@@ -1438,8 +1481,12 @@ program
         const experiment = await prisma.experiment.findUnique({
           where: { slug: experimentSlug },
           include: { 
-            singleVideoEvaluationTasks: true,
-            twoVideoComparisonTasks: true 
+            _count: {
+              select: {
+                singleVideoEvaluationTasks: true,
+                twoVideoComparisonTasks: true
+              }
+            }
           }
         });
         
@@ -1449,27 +1496,26 @@ program
         }
 
         console.log(chalk.white(`Found experiment: ${experiment.name}`));
-        console.log(chalk.white(`Single video tasks: ${experiment.singleVideoEvaluationTasks.length}`));
-        console.log(chalk.white(`Comparison tasks: ${experiment.twoVideoComparisonTasks.length}`));
+        console.log(chalk.white(`Single video tasks: ${experiment._count.singleVideoEvaluationTasks}`));
+        console.log(chalk.white(`Comparison tasks: ${experiment._count.twoVideoComparisonTasks}`));
 
-        let deletedTasks = 0;
-
-        // Delete single video evaluation tasks
-        if (experiment.singleVideoEvaluationTasks.length > 0) {
-          const result = await prisma.singleVideoEvaluationTask.deleteMany({
+        // Delete both task types in one transaction so a failure can't leave
+        // the experiment half-reset
+        const [singleResult, comparisonResult] = await prisma.$transaction([
+          prisma.singleVideoEvaluationTask.deleteMany({
             where: { experimentId: experiment.id }
-          });
-          deletedTasks += result.count;
-          console.log(chalk.blue(`Deleted ${result.count} single video evaluation tasks`));
-        }
-
-        // Delete comparison tasks  
-        if (experiment.twoVideoComparisonTasks.length > 0) {
-          const result = await prisma.twoVideoComparisonTask.deleteMany({
+          }),
+          prisma.twoVideoComparisonTask.deleteMany({
             where: { experimentId: experiment.id }
-          });
-          deletedTasks += result.count;
-          console.log(chalk.blue(`Deleted ${result.count} comparison tasks`));
+          })
+        ]);
+        const deletedTasks = singleResult.count + comparisonResult.count;
+
+        if (singleResult.count > 0) {
+          console.log(chalk.blue(`Deleted ${singleResult.count} single video evaluation tasks`));
+        }
+        if (comparisonResult.count > 0) {
+          console.log(chalk.blue(`Deleted ${comparisonResult.count} comparison tasks`));
         }
 
         console.log(chalk.green.bold(`\n✅ Reset complete! Deleted ${deletedTasks} tasks.`));
@@ -1652,26 +1698,44 @@ program
           // Auto-assign based on video metadata
           console.log(chalk.blue('\n🤖 Auto-assigning videos based on metadata...\n'));
           
-          // Use new video library API that supports metadata
-          const videoResponse = await fetch(`${getBaseUrl()}/api/videos`);
-          if (!videoResponse.ok) {
-            throw new Error(`Failed to fetch video library: ${videoResponse.status}`);
-          }
-          const videosWithMetadata = await videoResponse.json();
+          // The library fetched above already carries the metadata (it is the
+          // same Video rows /api/videos returns), so reuse it instead of
+          // downloading the whole library a second time
+          const videosWithMetadata = videos;
           
           const config = experiment.config as any;
           const scenarios = config?.scenarios || [];
           
-          // Auto-discover available models from uploaded videos
-          const availableModels = Array.from(new Set(
-            videosWithMetadata.filter((v: any) => v.modelName).map((v: any) => v.modelName)
-          ));
+          // Auto-discover available models and index videos by model/scenario in
+          // one pass (first match wins, same as the previous linear find)
+          const modelSet = new Set<string>();
+          const videoByModelScenario = new Map<string, any>();
+          for (const video of videosWithMetadata) {
+            if (!video.modelName) continue;
+            modelSet.add(video.modelName);
+            const key = `${video.modelName}::${video.scenarioId}`;
+            if (!videoByModelScenario.has(key)) {
+              videoByModelScenario.set(key, video);
+            }
+          }
+          const availableModels = Array.from(modelSet);
           
           if (availableModels.length === 0) {
             console.log(chalk.red('No videos with model names found in library.'));
             return;
           }
           
+          // Lower-cased names for the filename-pattern fallback, computed once
+          const lowerNames: string[] = videosWithMetadata.map((v: any) => v.name.toLowerCase());
+          const findByFilename = (scenario: string, model: string) => {
+            const scenarioLower = scenario.toLowerCase();
+            const modelLower = model.toLowerCase();
+            const index = lowerNames.findIndex(name =>
+              name.includes(scenarioLower) && name.includes(modelLower)
+            );
+            return index === -1 ? undefined : videosWithMetadata[index];
+          };
+          
           console.log(chalk.white(`Auto-discovered models: ${chalk.green(availableModels.join(', '))}`));
           
           const comparisons: any[] = [];
@@ -1683,26 +1747,10 @@ program
                 const modelB = availableModels[j];
                 
                 // Find videos by metadata first, fallback to filename patterns
-                let videoA = videosWithMetadata.find((v: any) => 
-                  v.modelName === modelA && v.scenarioId === scenario
-                );
-                let videoB = videosWithMetadata.find((v: any) => 
-                  v.modelName === modelB && v.scenarioId === scenario
-                );
-                
-                // Fallback to filename patterns if metadata not available
-                if (!videoA) {
-                  videoA = videosWithMetadata.find((v: any) => 
-                    v.name.toLowerCase().includes(scenario.toLowerCase()) && 
-                    v.name.toLowerCase().includes(modelA.toLowerCase())
-                  );
-                }
-                if (!videoB) {
-                  videoB = videosWithMetadata.find((v: any) => 
-                    v.name.toLowerCase().includes(scenario.toLowerCase()) && 
-                    v.name.toLowerCase().includes(modelB.toLowerCase())
-                  );
-                }
+                const videoA = videoByModelScenario.get(`${modelA}::${scenario}`)
+                  || findByFilename(scenario, modelA);
+                const videoB = videoByModelScenario.get(`${modelB}::${scenario}`)
+                  || findByFilename(scenario, modelB);
                 
                 if (videoA && videoB) {
                   comparisons.push({
@@ -1764,13 +1812,6 @@ program
         } else if (strategy === 'random') {
           console.log(chalk.blue('\n🎲 Random video assignment...\n'));
           
-          // Get videos with metadata
-          const videoResponse = await fetch(`${getBaseUrl()}/api/videos`);
-          if (!videoResponse.ok) {
-            throw new Error(`Failed to fetch video library: ${videoResponse.status}`);
-          }
-          await videoResponse.json();
-          
           if (seed) {
             console.log(chalk.gray(`Using random seed: ${seed}`));
           }
@@ -1862,7 +1903,8 @@ program
         
         console.log(chalk.yellow('\n🔄 Creating study on Prolific...'));
         
-        const prolificStudy = await prolificService.instance.instance.createStudy({
+        const prolific = await getProlificService();
+        const prolificStudy = await prolific.createStudy({
           experimentId: experiment.id,
           title,
           description,
@@ -1933,9 +1975,10 @@ program
         
         console.log(chalk.yellow('🔄 Fetching study details from Prolific...'));
         
+        const prolific = await getProlificService();
         for (const exp of experiments) {
           try {
-            const study = await prolificService.instance.getStudy(exp.prolificStudyId!);
+            const study = await prolific.getStudy(exp.prolificStudyId!);
             
             const statusColor = {
               'UNPUBLISHED': 'gray',
@@ -1986,8 +2029,12 @@ program
         
         console.log(chalk.yellow('🔄 Fetching study status...'));
         
-        const study = await prolificService.instance.getStudy(studyId);
-        const submissions = await prolificService.instance.getSubmissions(studyId);
+        // The study and its submissions are independent requests
+        const prolific = await getProlificService();
+        const [study, submissions] = await Promise.all([
+          prolific.getStudy(studyId),
+          prolific.getSubmissions(studyId)
+        ]);
         
         const statusColor = {
           'UNPUBLISHED': 'gray',
@@ -2007,19 +2054,20 @@ program
         
         if (submissions.results.length > 0) {
           console.log(chalk.blue('\n📋 Submissions:'));
-          const submissionCounts = submissions.results.reduce((acc, sub) => {
-            acc[sub.status] = (acc[sub.status] || 0) + 1;
-            return acc;
-          }, {} as Record<string, number>);
+          const submissionCounts = new Map<string, number>();
+          for (const sub of submissions.results) {
+            submissionCounts.set(sub.status, (submissionCounts.get(sub.status) || 0) + 1);
+          }
           
-          Object.entries(submissionCounts).forEach(([status, count]) => {
-            const color = {
-              'ACTIVE': 'yellow',
-              'AWAITING_REVIEW': 'cyan',
-              'APPROVED': 'green',
-              'REJECTED': 'red',
-              'RETURNED': 'gray'
-            }[status] || 'white';
+          const submissionStatusColor: Record<string, string> = {
+            'ACTIVE': 'yellow',
+            'AWAITING_REVIEW': 'cyan',
+            'APPROVED': 'green',
+            'REJECTED': 'red',
+            'RETURNED': 'gray'
+          };
+          submissionCounts.forEach((count, status) => {
+            const color = submissionStatusColor[status] || 'white';
             console.log(chalk[color](`  ${status}: ${count}`));
           });
         }
@@ -2052,7 +2100,8 @@ program
         }
         
         // Get current status
-        const study = await prolificService.instance.getStudy(studyId);
+        const prolific = await getProlificService();
+        const study = await prolific.getStudy(studyId);
         
         if (study.status !== 'UNPUBLISHED') {
           console.log(chalk.yellow(`Study is already ${study.status.toLowerCase()}. Cannot publish.`));
@@ -2260,6 +2309,7 @@ program
   .description('Sync Prolific study data with database including participant demographics')
   .option('-s, --study <studyId>', 'Prolific study ID')
   .option('--all', 'Sync all studies')
+  .option('-c, --concurrency <n>', 'Number of studies to sync in parallel with --all', '3')
   .action(async (options) => {
     await requireAuth('sync Prolific data', async () => {
       try {
@@ -2271,26 +2321,8 @@ program
               prolificStudyId: { not: null }
             },
             select: {
-              id: true,
               name: true,
-              prolificStudyId: true,
-              status: true,
-              createdAt: true,
-              _count: {
-                select: {
-                  participants: {
-                    where: {
-                      id: {
-                        not: {
-                          startsWith: 'anon-session-'
-                        }
-                      }
-                    }
-                  },
-                  twoVideoComparisonSubmissions: true,
-                  twoVideoComparisonTasks: true
-                }
-              }
+              prolificStudyId: true
             }
           });
           
@@ -2300,23 +2332,32 @@ program
           }
           
           let totalSynced = 0;
+          let completed = 0;
+          const concurrency = Math.max(1, parseInt(options.concurrency) || 3);
+          
+          console.log(chalk.blue(`📡 Syncing ${experiments.length} studies (${concurrency} at a time)...\n`));
           
-          for (const exp of experiments) {
+          // Studies are independent, so sync a few at a time; each study's
+          // result is printed as one block so parallel output doesn't interleave
+          const prolific = await getProlificService();
+          await mapWithConcurrency(experiments, concurrency, async (exp) => {
             try {
-              console.log(chalk.yellow(`📡 Syncing ${exp.name} (${exp.prolificStudyId})...`));
-              
-              const result = await prolificService.instance.syncStudyWithDatabase(exp.prolificStudyId!);
-              
-              console.log(chalk.green(`  ✅ Synced ${result.syncedParticipants} participants`));
-              console.log(chalk.gray(`  📊 Study status: ${result.study.status}`));
-              console.log(chalk.gray(`  👥 Submissions: ${result.submissions.length}`));
-              
+              const result = await prolific.syncStudyWithDatabase(exp.prolificStudyId!);
               totalSynced += result.syncedParticipants;
+              completed++;
+              
+              console.log([
+                chalk.yellow(`[${completed}/${experiments.length}] ${exp.name} (${exp.prolificStudyId})`),
+                chalk.green(`  ✅ Synced ${result.syncedParticipants} participants`),
+                chalk.gray(`  📊 Study status: ${result.study.status}`),
+                chalk.gray(`  👥 Submissions: ${result.submissions.length}`)
+              ].join('\n'));
               
             } catch (error) {
-              console.log(chalk.red(`  ❌ Failed to sync ${exp.name}: ${error}`));
+              completed++;
+              console.log(chalk.red(`[${completed}/${experiments.length}] ❌ Failed to sync ${exp.name}: ${error}`));
             }
-          }
+          });
           
           console.log(chalk.green.bold(`\n✅ Sync complete! Total participants synced: ${totalSynced}`));
           
@@ -2331,7 +2372,8 @@ program
           console.log(chalk.blue.bold('\n🔄 Syncing Prolific Study\n'));
           console.log(chalk.yellow(`📡 Syncing study ${studyId}...`));
           
-          const result = await prolificService.instance.syncStudyWithDatabase(studyId);
+          const prolific = await getProlificService();
+          const result = await prolific.syncStudyWithDatabase(studyId);
           
           console.log(chalk.green.bold('\n✅ Sync complete!\n'));
           console.log(chalk.white('Study:'), chalk.yellow(result.study.name));
@@ -2788,25 +2830,13 @@ program
           // Count all main tables
           console.log(chalk.blue.bold('\n📊 Record Counts\n'));
           
-          const tables = [
-            'Experiment',
-            'TwoVideoComparisonTask', 
-            'TwoVideoComparisonSubmission',
-            'SingleVideoEvaluationTask',
-            'SingleVideoEvaluationSubmission',
-            'Participant',
-            'Video',
-            'organizations',
-            'organization_members'
-          ];
-          
-          for (const table of tables) {
-            try {
-              const result = await prisma.$queryRawUnsafe(`SELECT COUNT(*) as count FROM "${table}"`);
-              const count = Array.isArray(result) ? result[0]?.count : 0;
-              console.log(chalk.white(`${table}: `) + chalk.yellow(Number(count).toLocaleString()));
-            } catch (error) {
+          const counts = await countTables(MAIN_TABLES);
+          for (const table of MAIN_TABLES) {
+            const count = counts.get(table);
+            if (count == null) {
               console.log(chalk.white(`${table}: `) + chalk.red('Error'));
+            } else {
+              console.log(chalk.white(`${table}: `) + chalk.yellow(count.toLocaleString()));
             }
           }
         }
@@ -2826,16 +2856,7 @@ program
   .action(async (options) => {
     await requireAuth('view storage', async () => {
       try {
-        const { S3Client, ListObjectsV2Command } = await import('@aws-sdk/client-s3');
-        
-        const client = new S3Client({
-          endpoint: process.env.AWS_ENDPOINT_URL_S3 || 'https://fly.storage.tigris.dev',
-          region: process.env.AWS_REGION || 'auto',
-          credentials: {
-            accessKeyId: process.env.AWS_ACCESS_KEY_ID!,
-            secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY!,
-          },
-        });
+        const { printObjectListing } = await import('./s3-client');
         
         const bucketName = options.bucket || process.env.TIGRIS_BUCKET_NAME || 'eval-data';
         
@@ -2845,38 +2866,11 @@ program
         }
         console.log();
         
-        const command = new ListObjectsV2Command({
-          Bucket: bucketName,
-          Prefix: options.prefix,
-        });
-        
-        const response = await client.send(command);
-        
-        if (!response.Contents || response.Contents.length === 0) {
-          console.log(chalk.gray('No objects found'));
-          return;
-        }
-        
-        let totalSize = 0;
-        
-        response.Contents.forEach((obj) => {
-          const sizeMB = (obj.Size || 0) / (1024 * 1024);
-          totalSize += obj.Size || 0;
-          
-          if (options.detailed) {
-            const modified = obj.LastModified?.toISOString().slice(0, 16).replace('T', ' ') || 'Unknown';
-            console.log(chalk.white(`${obj.Key}`));
-            console.log(chalk.gray(`  Size: ${sizeMB.toFixed(2)} MB`));
-            console.log(chalk.gray(`  Modified: ${modified}`));
-            console.log(chalk.gray(`  Storage: ${obj.StorageClass || 'STANDARD'}`));
-            console.log();
-          } else {
-            console.log(chalk.white(`${obj.Key} `) + chalk.yellow(`(${sizeMB.toFixed(2)} MB)`));
-          }
+        await printObjectListing(bucketName, {
+          prefix: options.prefix,
+          detailed: options.detailed,
         });
         
-        console.log(chalk.blue(`\n📊 Total: ${response.Contents.length} objects, ${(totalSize / (1024 * 1024)).toFixed(2)} MB`));
-        
       } catch (error) {
         console.error(chalk.red('Error listing storage objects:'), error);
       }
@@ -2896,7 +2890,7 @@ program
         
         if (Array.isArray(result) && result.length > 0) {
           if (options.format === 'json') {
-            console.log(JSON.stringify(result, null, 2));
+            writeJsonRows(result);
           } else {
             // Table format
             console.log(chalk.blue.bold('📋 Results:\n'));
@@ -1,4 +1,11 @@
 import { PrismaClient } from '@prisma/client';
 
+// Share one client (and so one connection pool) per CLI process. Registering it
+// on the same global the frontend's lib/prisma checks means modules loaded from
+// the frontend (e.g. the Prolific service) reuse this client instead of opening
+// a second pool and paying the connection handshake again.
+const globalForPrisma = global as unknown as { prisma?: PrismaClient };
 
-export const prisma = new PrismaClient();
\ No newline at end of file
+export const prisma = globalForPrisma.prisma ?? new PrismaClient();
+
+globalForPrisma.prisma = prisma;
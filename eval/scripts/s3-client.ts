@@ -0,0 +1,65 @@
+import chalk from 'chalk';
+import { S3Client, paginateListObjectsV2, _Object } from '@aws-sdk/client-s3';
+import { getTigrisClientConfig } from '../frontend/src/lib/storage';
+
+// One S3 client per CLI process, built with the same settings as the web app's
+// client. It comes from the scripts' own copy of @aws-sdk/client-s3 rather than
+// the frontend's: paginators check `instanceof S3Client` against the package
+// they were imported from, so scripts must pair their paginators and commands
+// with this client, not with the client lib/storage keeps for uploads.
+let s3Client: S3Client | null = null;
+
+export function getS3Client(): S3Client {
+  if (!s3Client) {
+    s3Client = new S3Client(getTigrisClientConfig());
+  }
+  return s3Client;
+}
+
+const toMB = (size?: number) => ((size || 0) / (1024 * 1024)).toFixed(2);
+
+// Print every object under a prefix followed by a total. Walks every page (at
+// most 1000 keys each) and prints objects as they arrive, keeping only running
+// totals in memory
+export async function printObjectListing(
+  bucketName: string,
+  options: { prefix?: string; detailed?: boolean } = {}
+): Promise<void> {
+  const pages = paginateListObjectsV2({ client: getS3Client() }, {
+    Bucket: bucketName,
+    Prefix: options.prefix || undefined,
+  });
+
+  // Pick the row formatter once rather than branching for every object
+  const formatObject = options.detailed
+    ? (obj: _Object) => [
+        chalk.white(`${obj.Key}`),
+        chalk.gray(`  Size: ${toMB(obj.Size)} MB`),
+        chalk.gray(`  Modified: ${obj.LastModified?.toISOString().slice(0, 16).replace('T', ' ') || 'Unknown'}`),
+        chalk.gray(`  Storage: ${obj.StorageClass || 'STANDARD'}`),
+        ''
+      ].join('\n')
+    : (obj: _Object) => chalk.white(`${obj.Key} `) + chalk.yellow(`(${toMB(obj.Size)} MB)`);
+
+  let objectCount = 0;
+  let totalSize = 0;
+
+  for await (const page of pages) {
+    const contents = page.Contents || [];
+    if (contents.length === 0) continue;
+
+    objectCount += contents.length;
+    totalSize += contents.reduce((sum, obj) => sum + (obj.Size || 0), 0);
+
+    // Render the page into one string and write it once, instead of a
+    // console.log call per line
+    process.stdout.write(contents.map(formatObject).join('\n') + '\n');
+  }
+
+  if (objectCount === 0) {
+    console.log(chalk.gray('No objects found'));
+    return;
+  }
+
+  console.log(chalk.blue(`\n📊 Total: ${objectCount} objects, ${toMB(totalSize)} MB`));
+}
@@ -10,7 +10,14 @@ import chalk from 'chalk';
 import * as dotenv from 'dotenv';
 import * as path from 'path';
 import * as fs from 'fs';
-import { S3Client, ListObjectsV2Command, HeadObjectCommand, DeleteObjectCommand, PutObjectCommand } from '@aws-sdk/client-s3';
+import {
+  paginateListObjectsV2,
+  HeadObjectCommand,
+  DeleteObjectCommand,
+  PutObjectCommand,
+} from '@aws-sdk/client-s3';
+import { MULTIPART_THRESHOLD, uploadMultipart } from '../frontend/src/lib/storage';
+import { getS3Client, printObjectListing } from './s3-client';
 
 // Load environment variables
 dotenv.config({ path: path.join(__dirname, '../frontend/.env.local') });
@@ -23,22 +30,45 @@ program
   .description('Storage management utilities for Tigris/S3')
   .version('1.0.0');
 
-// Initialize S3 client
-function getS3Client() {
-  return new S3Client({
-    endpoint: process.env.AWS_ENDPOINT_URL_S3 || 'https://fly.storage.tigris.dev',
-    region: process.env.AWS_REGION || 'auto',
-    credentials: {
-      accessKeyId: process.env.AWS_ACCESS_KEY_ID!,
-      secretAccessKey: process.env.AWS_SECRET_ACCESS_KEY!,
-    },
-  });
-}
-
 function getBucketName() {
   return process.env.TIGRIS_BUCKET_NAME || 'eval-data';
 }
 
+// Each part is read straight from disk when it is due, so only
+// MULTIPART_CONCURRENCY parts are held in memory at a time
+async function uploadFileMultipart(
+  bucketName: string,
+  key: string,
+  file: string,
+  fileSize: number,
+  contentType: string
+) {
+  const handle = await fs.promises.open(file, 'r');
+  let uploadedBytes = 0;
+
+  try {
+    await uploadMultipart({
+      bucketName,
+      key,
+      size: fileSize,
+      contentType,
+      acl: 'public-read',
+      readPart: async (start, end) => {
+        const body = Buffer.alloc(end - start);
+        await handle.read(body, 0, body.length, start);
+        return body;
+      },
+      onPartUploaded: (bytes) => {
+        uploadedBytes += bytes;
+        process.stdout.write(chalk.gray(`\r   Uploaded ${(uploadedBytes / (1024 * 1024)).toFixed(2)} / ${(fileSize / (1024 * 1024)).toFixed(2)} MB`));
+      },
+    });
+    process.stdout.write('\n');
+  } finally {
+    await handle.close();
+  }
+}
+
 // List objects command
 program
   .command('list')
@@ -47,7 +77,6 @@ program
   .option('-d, --detailed', 'Show detailed information')
   .action(async (options) => {
     try {
-      const s3Client = getS3Client();
       const bucketName = getBucketName();
       
       console.log(chalk.blue.bold(`\n📁 Listing objects in bucket '${bucketName}'`));
@@ -55,36 +84,11 @@ program
         console.log(chalk.gray(`   Prefix: ${options.prefix}`));
       }
 
-      const command = new ListObjectsV2Command({
-        Bucket: bucketName,
-        Prefix: options.prefix || undefined,
-      });
-
-      const response = await s3Client.send(command);
-      const objects = response.Contents || [];
-
-      if (objects.length === 0) {
-        console.log(chalk.gray('No objects found'));
-        return;
-      }
-
-      let totalSize = 0;
-      objects.forEach((obj: any) => {
-        const sizeMB = (obj.Size || 0) / (1024 * 1024);
-        totalSize += obj.Size || 0;
-        
-        if (options.detailed) {
-          console.log(chalk.white(obj.Key));
-          console.log(chalk.gray(`  Size: ${sizeMB.toFixed(2)} MB`));
-          console.log(chalk.gray(`  Modified: ${obj.LastModified?.toISOString()}`));
-          console.log();
-        } else {
-          console.log(chalk.white(obj.Key), chalk.gray(`(${sizeMB.toFixed(2)} MB)`));
-        }
+      await printObjectListing(bucketName, {
+        prefix: options.prefix,
+        detailed: options.detailed,
       });
 
-      console.log(chalk.blue(`\n📊 Total: ${objects.length} objects, ${(totalSize / (1024 * 1024)).toFixed(2)} MB`));
-
     } catch (error) {
       console.error(chalk.red('Error listing storage objects:'), error);
       process.exit(1);
@@ -105,16 +109,17 @@ program
       console.log(chalk.white('Endpoint:'), chalk.yellow(process.env.AWS_ENDPOINT_URL_S3 || 'https://fly.storage.tigris.dev'));
       console.log(chalk.white('Region:'), chalk.yellow(process.env.AWS_REGION || 'auto'));
 
-      // Get bucket statistics
-      const command = new ListObjectsV2Command({
-        Bucket: bucketName,
-      });
-
-      const response = await s3Client.send(command);
-      const objects = response.Contents || [];
-      const totalSize = objects.reduce((sum: number, obj: any) => sum + (obj.Size || 0), 0);
+      // Get bucket statistics across all pages
+      let objectCount = 0;
+      let totalSize = 0;
+      for await (const page of paginateListObjectsV2({ client: s3Client }, { Bucket: bucketName })) {
+        for (const obj of page.Contents || []) {
+          objectCount++;
+          totalSize += obj.Size || 0;
+        }
+      }
 
-      console.log(chalk.white('Objects:'), chalk.yellow(`${objects.length.toLocaleString()}`));
+      console.log(chalk.white('Objects:'), chalk.yellow(`${objectCount.toLocaleString()}`));
       console.log(chalk.white('Total Size:'), chalk.yellow(`${(totalSize / (1024 * 1024)).toFixed(2)} MB`));
       console.log(chalk.green('\n✅ Bucket accessible'));
 
@@ -134,13 +139,14 @@ program
       const s3Client = getS3Client();
       const bucketName = getBucketName();
 
-      if (!fs.existsSync(file)) {
+      // A single stat both checks the file exists and gives its size
+      const stats = fs.statSync(file, { throwIfNoEntry: false });
+      if (!stats || !stats.isFile()) {
         console.error(chalk.red(`File not found: ${file}`));
         process.exit(1);
       }
 
-      const fileData = fs.readFileSync(file);
-      const fileSize = fs.statSync(file).size;
+      const fileSize = stats.size;
 
       // Auto-detect content type if not specified
       let contentType = options.contentType;
@@ -162,15 +168,19 @@ program
       console.log(chalk.gray(`   Destination: ${bucketName}/${key}`));
       console.log(chalk.gray(`   Content-Type: ${contentType}`));
 
-      const command = new PutObjectCommand({
-        Bucket: bucketName,
-        Key: key,
-        Body: fileData,
-        ContentType: contentType,
-        ACL: 'public-read',
-      });
+      if (fileSize >= MULTIPART_THRESHOLD) {
+        await uploadFileMultipart(bucketName, key, file, fileSize, contentType);
+      } else {
+        const command = new PutObjectCommand({
+          Bucket: bucketName,
+          Key: key,
+          Body: fs.readFileSync(file),
+          ContentType: contentType,
+          ACL: 'public-read',
+        });
 
-      await s3Client.send(command);
+        await s3Client.send(command);
+      }
 
       const publicUrl = `https://${process.env.AWS_ENDPOINT_URL_S3?.replace('https://', '') || 'fly.storage.tigris.dev'}/${bucketName}/${key}`;
       